@@ -1,8 +1,14 @@
-from IPython import display
 import imageio
 import os
+import queue
+import traceback
 import multiprocessing as mp
+from multiprocessing import shared_memory
 import numpy as np
+import matplotlib.pyplot as plt
+
+from fridom.Framework.StateBase import StateBase
+from fridom.Framework.FieldVariable import FieldVariable
 
 class ModelPlotterBase:
     def create_figure():
@@ -17,6 +23,9 @@ class ModelPlotterBase:
 
 class LiveAnimation:
     def __init__(self, live_plotter:ModelPlotterBase) -> None:
+        # IPython is only needed for live animations (imported on demand)
+        from IPython import display
+        self.display = display
         self.live_plotter = live_plotter
         self.fig = self.live_plotter.create_figure()
 
@@ -26,14 +35,18 @@ class LiveAnimation:
         # update the figure
         self.live_plotter.update_figure(fig=self.fig, **kwargs)
         # display the figure
-        display.display(self.fig)
+        self.display.display(self.fig)
         # clear the output when the next figure is ready
-        display.clear_output(wait=True)
+        self.display.clear_output(wait=True)
 
 
 class VideoAnimation:
     """
-    Class for parallel animated plotting of the model.
+    Class for parallel animated plotting of the model. The figures are 
+    created by persistent worker processes, that are started with the 
+    first frame. The arrays of the states and fields are passed to the 
+    workers through a ring of shared memory blocks, only the remaining 
+    (small) keyword arguments go through the queue.
     """
     def __init__(self, live_plotter:ModelPlotterBase, filename:str, fps:int,
                  max_jobs=0.4) -> None:
@@ -58,12 +71,18 @@ class VideoAnimation:
             os.remove(filename)
         self.filename = filename
 
-        # list for the jobs and queues for creating the figures
-        self.running_jobs = []       # Processes
-        self.open_queues  = []       # Queues
+        # worker processes and queues (started with the first frame)
+        self.workers      = None     # Processes
+        self.input_queue  = None     # frames to plot
+        self.output_queue = None     # finished images
+
+        # shared memory blocks for the frame data
+        self.blocks      = None      # SharedMemory objects
+        self.block_views = None      # arrays in the shared memory blocks
+        self.free_blocks = None      # indices of the unused blocks
 
         # use maximum of 40% the available threads
-        self.maximum_jobs = int(max_jobs*mp.cpu_count())
+        self.maximum_jobs = max(1, int(max_jobs*mp.cpu_count()))
         return
 
     def start_writer(self):
@@ -71,76 +90,256 @@ class VideoAnimation:
         Method to start the writer process.
         """
         self.writer = imageio.get_writer(self.filename, fps=self.fps)
+        # frame counters: frames sent to the workers / added to the video
+        self.frames_sent = 0
+        self.frames_written = 0
+        self.finished_frames = {}
         return
 
     def stop_writer(self):
         """
         Method to stop the writer process.
         """
-        # collect all figures
-        while len(self.running_jobs) > 0:
-            self.collect_figures()
+        if self.workers is not None:
+            # stop the workers after the remaining frames
+            for _ in self.workers:
+                self.input_queue.put(None)
+            # collect all figures
+            while self.frames_written < self.frames_sent:
+                self.collect_figures(block=True)
+            for worker in self.workers:
+                worker.join()
+            self.release_workers()
         self.writer.close()
         return
 
+    def release_workers(self):
+        """
+        Terminate the workers that are still running and release the 
+        shared memory blocks.
+        """
+        for worker in self.workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        self.workers = None
+
+        # release the shared memory
+        self.block_views = None
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = None
+        return
+
+    def abort(self, message:str):
+        """
+        Stop the workers and the video writer after a failed worker and 
+        raise a RuntimeError.
+        """
+        self.release_workers()
+        self.writer.close()
+        raise RuntimeError(f"Video animation failed: {message}")
+
+    def start_workers(self, template:dict):
+        """
+        Allocate the shared memory blocks and start the persistent worker 
+        processes.
+
+        Arguments:
+            template (dict) : keyword arguments of the first frame. The 
+                              workers get a copy of them and only replace
+                              the arrays for each frame.
+        """
+        # one block per frame in flight (two per worker)
+        layout = [(arr.shape, arr.dtype) 
+                  for arr in VideoAnimation.get_arrays(template)]
+        n_bytes = sum(VideoAnimation.aligned(np.dtype(dtype).itemsize * 
+                      int(np.prod(shape))) for shape, dtype in layout)
+        n_blocks = 2 * self.maximum_jobs
+        self.blocks = [shared_memory.SharedMemory(create=True, 
+                       size=max(n_bytes, 1)) for _ in range(n_blocks)]
+        self.block_views = [VideoAnimation.get_block_views(block, layout) 
+                            for block in self.blocks]
+        self.free_blocks = list(range(n_blocks))
+
+        self.input_queue = mp.Queue()
+        self.output_queue = mp.Queue()
+        self.workers = [
+            mp.Process(target=VideoAnimation.p_worker, args=(
+                self.live_plotter, template, self.blocks, layout,
+                self.input_queue, self.output_queue))
+            for _ in range(self.maximum_jobs)]
+        for worker in self.workers:
+            worker.start()
+        return
+
     def update(self, **kwargs):
         """
         Update method of the parallel animated model.
         """
+        if self.workers is None:
+            self.start_workers(kwargs)
+
         # collect finished figures
         self.collect_figures()
 
-        # wait until there is space for a new job
-        while len(self.running_jobs) >= self.maximum_jobs:
-            self.collect_figures()
+        # wait until there is a free block
+        while len(self.free_blocks) == 0:
+            self.collect_figures(block=True)
 
-        # create a new figure
-        q = mp.Queue()
-        kw = kwargs.copy()
-        kw["output_queue"] = q
-        kw["model_plotter"] = self.live_plotter
-        job = mp.Process(target=VideoAnimation.p_make_figure, kwargs=kw)
-        job.start()
+        # copy the frame into the shared memory block
+        ind = self.free_blocks.pop()
+        arrays = VideoAnimation.get_arrays(kwargs)
+        for view, arr in zip(self.block_views[ind], arrays):
+            view[:] = arr
 
-        self.open_queues.append(q)
-        self.running_jobs.append(job)
+        self.input_queue.put(
+            (self.frames_sent, ind, VideoAnimation.get_scalars(kwargs)))
+        self.frames_sent += 1
         return
 
-    def collect_figures(self):
-        while len(self.running_jobs) > 0:
+    def collect_figures(self, block=False):
+        """
+        Add the finished figures to the video (in the order of the frames).
+
+        Arguments:
+            block (bool) : wait for at least one finished figure.
+        """
+        pending = (self.frames_sent - self.frames_written
+                   - len(self.finished_frames))
+        received = 0
+        while received < pending:
+            # drain the finished figures without waiting, only wait if 
+            # nothing is ready and a figure is requested
             try :
-                img = self.open_queues[0].get(timeout=0.05)
-            except:
+                if block and received == 0:
+                    frame, ind, img = self.output_queue.get(timeout=0.05)
+                else:
+                    frame, ind, img = self.output_queue.get_nowait()
+            except queue.Empty:
+                if block and received == 0:
+                    # don't wait for figures of workers that died (or 
+                    # when all workers are done)
+                    failed = any(worker.exitcode not in (None, 0) 
+                                 for worker in self.workers)
+                    if failed or not any(worker.is_alive() 
+                                         for worker in self.workers):
+                        self.abort("a worker process died")
+                    continue
                 break
+            if frame is None:
+                # error sentinel of a worker (img is the traceback)
+                self.abort(f"error in a worker process\n{img}")
+            received += 1
+            self.finished_frames[frame] = img
+            self.free_blocks.append(ind)
 
-            # add the figure to the video
+        # add the figures to the video
+        while self.frames_written in self.finished_frames:
+            img = self.finished_frames.pop(self.frames_written)
             self.writer.append_data(img)
+            self.frames_written += 1
+        return
+
+    # =====================================================================
+    #  FRAME DATA
+    # =====================================================================
 
-            # remove the finished job and queue
-            self.running_jobs[0].join()
-            self.running_jobs.pop(0)
-            self.open_queues.pop(0)
+    def get_arrays(kwargs:dict) -> list:
+        """
+        List of the arrays of all states and fields in the keyword arguments.
+        """
+        arrays = []
+        for val in kwargs.values():
+            if isinstance(val, StateBase):
+                arrays += [field.arr for field in val.field_list]
+            elif isinstance(val, FieldVariable):
+                arrays.append(val.arr)
+        return arrays
+
+    def set_arrays(kwargs:dict, arrays:list) -> None:
+        """
+        Replace the arrays of all states and fields in the keyword arguments.
+        """
+        arrays = iter(arrays)
+        for val in kwargs.values():
+            if isinstance(val, StateBase):
+                for field in val.field_list:
+                    field.arr = next(arrays)
+            elif isinstance(val, FieldVariable):
+                val.arr = next(arrays)
         return
 
+    def get_scalars(kwargs:dict) -> dict:
+        """
+        All keyword arguments that are neither states nor fields.
+        """
+        return {key: val for key, val in kwargs.items() 
+                if not isinstance(val, (StateBase, FieldVariable))}
+
+    def aligned(n_bytes:int) -> int:
+        """
+        Round up to a multiple of 64 bytes.
+        """
+        return -(-n_bytes // 64) * 64
+
+    def get_block_views(block, layout:list) -> list:
+        """
+        Arrays with the given layout in a shared memory block.
+
+        Arguments:
+            block (SharedMemory) : shared memory block
+            layout (list)        : list of (shape, dtype) of the arrays
+        """
+        views = []; offset = 0
+        for shape, dtype in layout:
+            views.append(np.ndarray(shape, dtype=dtype, 
+                                    buffer=block.buf, offset=offset))
+            offset += VideoAnimation.aligned(views[-1].nbytes)
+        return views
+
     # =====================================================================
     #  PARALLEL FUNCTIONS
     # =====================================================================
 
-    def p_make_figure(**kwargs):
+    def p_worker(model_plotter, template, blocks, layout,
+                 input_queue, output_queue):
         """
-        Parallel function that gets a ModelPlotter object, makes the image 
-        of it and puts it in the output queue.
+        Persistent worker process that makes the images of the frames in 
+        the input queue and puts them in the output queue.
 
         Arguments:
-            modelplot (ModelPlotter): model plotter object
-            output_queue (mp.Queue) : output queue
+            model_plotter (ModelPlotter): model plotter object
+            template (dict)         : keyword arguments of the first frame
+            blocks (list)           : shared memory blocks
+            layout (list)           : list of (shape, dtype) of the arrays
+            input_queue (mp.Queue)  : input queue (None to stop)
+            output_queue (mp.Queue) : output queue (frame None and the 
+                                      traceback in case of an error)
         """
-        # get output queue
-        output_queue = kwargs["output_queue"]
-        model_plotter = kwargs["model_plotter"]
+        block_views = [VideoAnimation.get_block_views(block, layout) 
+                       for block in blocks]
+        # the figure is created once and cleared for each frame
         fig = model_plotter.create_figure()
-        model_plotter.update_figure(fig=fig, **kwargs)
+        while True:
+            item = input_queue.get()
+            if item is None:
+                break
+            frame, ind, scalars = item
+            # the plotter reads the arrays in the shared memory block
+            VideoAnimation.set_arrays(template, block_views[ind])
+            kwargs = dict(template)
+            kwargs.update(scalars)
 
-        img = model_plotter.convert_to_img(fig)
-        output_queue.put(img)
+            try:
+                fig.clf()
+                model_plotter.update_figure(fig=fig, **kwargs)
+                img = model_plotter.convert_to_img(fig)
+            except Exception:
+                # error sentinel for the main process
+                output_queue.put((None, ind, traceback.format_exc()))
+                break
+            output_queue.put((frame, ind, img))
+        plt.close(fig)
         return
@@ -52,7 +52,7 @@ class DiagnoseImbalanceBase:
         self.z_ini_bal = z_bal.copy() if self.store_details else None
 
         verbose(f"Running model for {self.diag_per} seconds")
-        model.z = z_bal
+        model.z = z_bal   # copied by the model
         model.run(runlen=self.diag_per)
 
         self.z_fin = model.z.copy() if self.store_details else None
@@ -1,6 +1,7 @@
 import numpy
 try :
     import cupy
+    import cupyx
 except ImportError:
     pass
 
@@ -32,7 +33,7 @@ class FieldVariable:
 
     def __init__(self, mset:ModelSettingsBase, grid:GridBase,
                  is_spectral=False, name="Unnamed", bc=BoundaryConditions,
-                 arr=None) -> None:
+                 arr=None, copy=True) -> None:
         """
         Creates a FieldVariable initialized from input array if given.
         Else, creates a FieldVariable initialized with zeros.
@@ -44,6 +45,9 @@ class FieldVariable:
             is_spectral (bool)   : True if the FieldVariable is in spectral space
             name (str)           : Name of the FieldVariable
             bc (Boundary Condition) : Boundary condition
+            copy (bool)          : If False, the input array is used without
+                                   a copy when it is already contiguous and
+                                   has the right dtype (default: True)
         """
         self.name = name
         self.mset = mset
@@ -59,8 +63,11 @@ class FieldVariable:
                 self.arr = cp.zeros(shape=grid.K[0].shape, dtype=dtype)
             else:
                 self.arr = cp.zeros(shape=tuple(mset.N), dtype=dtype)
+        elif copy:
+            # always a C-contiguous copy (also for strided views or transposes)
+            self.arr = cp.array(arr, dtype=dtype, order="C")
         else:
-            self.arr = cp.array(arr, dtype=dtype)
+            self.arr = cp.ascontiguousarray(arr, dtype=dtype)
 
         self.forward = lambda x: cp.fft.fftn(bc.pad_for_fft(x))
         self.backward = lambda x: bc.unpad_from_fft(cp.fft.ifftn(x).real)
@@ -70,12 +77,30 @@ class FieldVariable:
         """
         Return a copy of the FieldVariable
         """
-        return FieldVariable(arr=self.arr.copy(), **self.get_kw())
+        return self.wrap(self.arr.copy())
 
-    def cpu(self):
+    def __deepcopy__(self, memo):
+        """
+        Deep copy of the FieldVariable. Only the array is copied, the model
+        settings, the grid and the boundary condition are shared.
+        """
+        return self.copy()
+
+    def cpu(self, out=None):
         """
         Return a copy of the FieldVariable on the CPU
+
+        Arguments:
+            out (FieldVariable) : CPU FieldVariable to copy the data into
+                                  (reuses its buffer, default: None)
         """
+        if out is not None:
+            if self.mset.gpu:
+                self.arr.get(out=out.arr)
+            else:
+                out.arr[:] = self.arr
+            return out
+
         mset_cpu = self.mset.copy()
         mset_cpu.gpu = False
         # transform grid to CPU
@@ -85,14 +110,38 @@ class FieldVariable:
         kw["mset"] = mset_cpu
         kw["grid"] = grid_cpu
 
-        arr = self.arr.get() if self.mset.gpu else self.arr
+        if self.mset.gpu:
+            # copy into page-locked host memory (faster transfers, also for
+            # later copies when the field is reused as out buffer)
+            pinned = cupyx.empty_pinned(self.arr.shape, dtype=self.arr.dtype)
+            self.arr.get(out=pinned)
+            return FieldVariable(arr=pinned, copy=False, **kw)
 
-        return FieldVariable(arr=arr, **kw)
+        return FieldVariable(arr=self.arr, **kw)
         
     # ==================================================================
     #  OTHER METHODS
     # ==================================================================
 
+    def wrap(self, arr, is_spectral=None):
+        """
+        Wrap an array in a new FieldVariable with the attributes of self.
+        Unlike the constructor, the array is not copied if it is already
+        contiguous and has the right dtype.
+
+        Arguments:
+            arr (ndarray)        : The array to be wrapped
+            is_spectral (bool)   : Spectral flag of the new FieldVariable
+                                   (default: same as self)
+        """
+        new = FieldVariable.__new__(FieldVariable)
+        new.__dict__.update(self.__dict__)
+        if is_spectral is not None:
+            new.is_spectral = is_spectral
+        dtype = self.mset.ctype if new.is_spectral else self.mset.dtype
+        new.arr = self.cp.ascontiguousarray(arr, dtype=dtype)
+        return new
+
     def get_kw(self):
         """
         Return a dictionary with the keyword arguments for the
@@ -108,16 +157,11 @@ class FieldVariable:
         Returns:
             FieldVariable: Fourier transform of the FieldVariable
         """
-        cp = self.cp
         if self.is_spectral:
-            res = cp.array(self.backward(self.arr), dtype=self.mset.dtype)
+            res = self.backward(self.arr)
         else:
-            res = cp.array(self.forward(self.arr), dtype=self.mset.ctype)
-
-        kw = self.get_kw()
-        kw["is_spectral"] = not self.is_spectral
-
-        return FieldVariable(arr=res, **kw)
+            res = self.forward(self.arr)
+        return self.wrap(res, is_spectral=not self.is_spectral)
 
     def spectra_1d(self, nbins=50) -> tuple:
         """
@@ -182,7 +226,7 @@ class FieldVariable:
         Returns:
             FieldVariable: Square root of the FieldVariable
         """
-        return FieldVariable(arr=self.cp.sqrt(self.arr), **self.get_kw())
+        return self.wrap(self.cp.sqrt(self.arr))
 
     def norm_l2(self):
         """
@@ -191,7 +235,8 @@ class FieldVariable:
         Returns:
             float: L2 norm of the FieldVariable
         """
-        return self.cp.linalg.norm(self.arr)
+        # one reduction (no temporary array of the squared values)
+        return self.cp.sqrt(self.cp.vdot(self.arr, self.arr).real)
 
     def pad_raw(self, pad_width):
         """
@@ -249,9 +294,8 @@ class FieldVariable:
                          for i in range(self.mset.n_dims)])
 
         # compute the average
-        print(p_arr.shape)
         ave = 0.5*(p_arr[center] + p_arr[shifted])
-        return FieldVariable(arr=ave, **self.get_kw())
+        return self.wrap(ave)
         
 
     def diff_forward(self, axis):
@@ -284,7 +328,7 @@ class FieldVariable:
 
         # calculate the forward difference
         diff = (p_arr[secon] - p_arr[first])/self.mset.dg[axis]
-        return FieldVariable(arr=diff, **self.get_kw())
+        return self.wrap(diff)
     
     def diff_backward(self, axis):
         """
@@ -316,7 +360,7 @@ class FieldVariable:
 
         # calculate the backward difference
         diff = (p_arr[secon] - p_arr[first])/self.mset.dg[axis]
-        return FieldVariable(arr=diff, **self.get_kw())
+        return self.wrap(diff)
         
     
     def diff_2(self, axis):
@@ -354,7 +398,7 @@ class FieldVariable:
 
         # calculate the second order difference
         diff = (p_arr[third] - 2*p_arr[secon] + p_arr[first])/self.mset.dg[axis]**2
-        return FieldVariable(arr=diff, **self.get_kw())
+        return self.wrap(diff)
 
     # ==================================================================
     #  SLICING
@@ -366,9 +410,65 @@ class FieldVariable:
     def __setitem__(self, key, value):
         self.arr[key] = value
 
+    # ==================================================================
+    #  ARRAY ATTRIBUTES
+    # ==================================================================
+    # Frequently used array attributes are explicit properties, so that 
+    # their lookup does not go through __getattr__.
+
+    @property
+    def shape(self) -> tuple:
+        """Shape of the underlying array."""
+        return self.arr.shape
+
+    @property
+    def dtype(self):
+        """Data type of the underlying array."""
+        return self.arr.dtype
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the underlying array."""
+        return self.arr.ndim
+
+    @property
+    def size(self) -> int:
+        """Number of elements of the underlying array."""
+        return self.arr.size
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of the underlying array."""
+        return self.arr.nbytes
+
+    @property
+    def real(self):
+        """Real part of the underlying array."""
+        return self.arr.real
+
+    @property
+    def imag(self):
+        """Imaginary part of the underlying array."""
+        return self.arr.imag
+
+    def conj(self):
+        """Complex conjugate of the underlying array."""
+        return self.arr.conj()
+
+    @property
+    def __array_struct__(self):
+        # numpy functions (e.g. np.pad) probe this first
+        return self.arr.__array_struct__
+
+    @property
+    def __cuda_array_interface__(self):
+        # cupy functions (e.g. cp.pad) probe this first
+        return self.arr.__cuda_array_interface__
+
     def __getattr__(self, name):
         """
-        Forward attribute access to the underlying array (e.g. shape)
+        Forward all other attribute access to the underlying array 
+        (e.g. mean, get)
         """
         try:
             return getattr(self.arr, name)
@@ -396,7 +496,7 @@ class FieldVariable:
         else:
             sum = self.arr + other
 
-        return FieldVariable(arr=sum, **self.get_kw())
+        return self.wrap(sum)
     
     def __radd__(self, other):
         return self.__add__(other)
@@ -417,11 +517,11 @@ class FieldVariable:
         else:
             diff = self.arr - other
 
-        return FieldVariable(arr=diff, **self.get_kw())
+        return self.wrap(diff)
     
     def __rsub__(self, other):
         res = other - self.arr
-        return FieldVariable(arr=res, **self.get_kw())
+        return self.wrap(res)
 
     def __mul__(self, other):
         """
@@ -439,7 +539,7 @@ class FieldVariable:
         else:
             prod = self.arr * other
 
-        return FieldVariable(arr=prod, **self.get_kw())
+        return self.wrap(prod)
     
     def __rmul__(self, other):
         return self.__mul__(other)
@@ -460,10 +560,10 @@ class FieldVariable:
         else:
             quot = self.arr / other
 
-        return FieldVariable(arr=quot, **self.get_kw())
+        return self.wrap(quot)
     
     def __rtruediv__(self, other):
-        return FieldVariable(arr=other / self.arr, **self.get_kw())
+        return self.wrap(other / self.arr)
 
     def __pow__(self, other):
         """
@@ -478,10 +578,65 @@ class FieldVariable:
         # Check that the other object is a FieldVariable
         if isinstance(other, FieldVariable):
             pow = self.arr ** other.arr
+        elif numpy.isscalar(other) and other == 2:
+            # most common case (energies, norms): avoid the generic power
+            pow = self.cp.square(self.arr)
         else:
             pow = self.arr ** other
 
-        return FieldVariable(arr=pow, **self.get_kw())
+        return self.wrap(pow)
+
+    # ==================================================================
+    #  IN-PLACE ARITHMETIC OPERATIONS
+    # ==================================================================
+
+    def __iadd__(self, other):
+        """
+        Add a FieldVariable or a scalar to self in-place (no new array)
+        """
+        if isinstance(other, FieldVariable):
+            other = other.arr
+        self.arr += other
+        return self
+
+    def __isub__(self, other):
+        """
+        Subtract a FieldVariable or a scalar from self in-place
+        """
+        if isinstance(other, FieldVariable):
+            other = other.arr
+        self.arr -= other
+        return self
+
+    def __imul__(self, other):
+        """
+        Multiply self with a FieldVariable or a scalar in-place
+        """
+        if isinstance(other, FieldVariable):
+            other = other.arr
+        self.arr *= other
+        return self
+
+    def __itruediv__(self, other):
+        """
+        Divide self by a FieldVariable or a scalar in-place
+        """
+        if isinstance(other, FieldVariable):
+            other = other.arr
+        self.arr /= other
+        return self
+
+    def __ipow__(self, other):
+        """
+        Raise self to the power of a FieldVariable or a scalar in-place
+        """
+        if isinstance(other, FieldVariable):
+            other = other.arr
+        elif numpy.isscalar(other) and other == 2:
+            self.cp.square(self.arr, out=self.arr)
+            return self
+        self.arr **= other
+        return self
 
     # ==================================================================
     #  STRING REPRESENTATION
@@ -1,7 +1,6 @@
 import numpy as np
 from tqdm import tqdm
 from abc import abstractmethod
-from IPython.display import Video
 
 from fridom.Framework.ModelSettingsBase import ModelSettingsBase
 from fridom.Framework.GridBase import GridBase
@@ -20,12 +19,13 @@ class ModelBase:
         grid (Grid)             : Grid.
         z (State)               : State variable.
         dz_list (list)          : List of tendency terms (for time stepping).
-        pointer (np.ndarray)    : Pointer for time stepping.
+        head (int)              : Index of the current tendency in dz_list.
         coeff_AB (np.ndarray)   : Adam-Bashforth coefficients.
         timer (TimingModule)    : Timer.
         writer (NetCDFWriter)   : NetCDF writer.
         live_animation (LiveAnimation) : Live animation.
         vid_animation (VideoAnimation) : Video animation.
+        vid_z (State)           : CPU buffer of the state for the video.
         it (int)                : Iteration counter.
         time (float)            : Model time.
         dz (State)              : Current tendency term.
@@ -37,8 +37,10 @@ class ModelBase:
         nonlinear_tendency()    : Calculate nonlinear tendency.
         time_stepping()         : Perform Adam-Bashforth time stepping.
         update_pointer()        : Update pointer for the time stepping.
+        get_dz(i)               : Tendency term of i time steps ago.
         update_coeff_AB()       : Upward ramping of Adam-Bashforth coefficients  
                                   after restart.
+        update_tendency_modules(): Select the tendency terms from the switches.
         get_writer_variables()  : Get variables to write to NetCDF file.
         set_live_animation()    : Prepare the live animation.
         set_vid_animation()     : Prepare the video animation.
@@ -60,19 +62,20 @@ class ModelBase:
         """
         self.mset = mset
         self.grid = grid
-        cp = grid.cp
 
-        # state variable
-        self.z = State(mset, grid, is_spectral=is_spectral)
+        # state variable (updated in-place by the time stepping)
+        self._z = State(mset, grid, is_spectral=is_spectral)
 
         # time stepping variables
         self.dz_list = [State(mset, grid, is_spectral=is_spectral) for _ in range(mset.time_levels)]
-        self.pointer = np.arange(mset.time_levels, dtype=np.int32)
+        self.head = 0
+        # the coefficients are kept on the host (scalars of the update)
         self.coeffs = [
-            cp.asarray(mset.AB1), cp.asarray(mset.AB2),
-            cp.asarray(mset.AB3), cp.asarray(mset.AB4)
+            np.asarray(mset.AB1), np.asarray(mset.AB2),
+            np.asarray(mset.AB3), np.asarray(mset.AB4)
         ]
-        self.coeff_AB = cp.zeros(mset.time_levels, dtype=mset.dtype)
+        self.coeff_AB = np.zeros(mset.time_levels, dtype=mset.dtype)
+        self.ab_tmp = None           # scratch array of the time stepping
 
         # Timer
         self.timer = TimingModule()
@@ -92,6 +95,7 @@ class ModelBase:
 
         # video animation
         self.vid_animation = None
+        self.vid_z = None            # reusable CPU buffer of the state
         self.set_vid_animation(mset.vid_plotter)
 
         # Iteration counter
@@ -118,6 +122,9 @@ class ModelBase:
         # progress bar
         tq = tqdm if self.mset.enable_tqdm else lambda x: x
 
+        # select the tendency terms from the model settings
+        self.update_tendency_modules()
+
         # start netcdf writer
         self.writer.start()
 
@@ -210,6 +217,17 @@ class ModelBase:
         # to implement in child class
         return
 
+    def update_tendency_modules(self) -> None:
+        """
+        Update the tendency terms that are selected by the switches in the
+        model settings (enable_nonlinear, etc.). Models that resolve the 
+        switches once instead of every time step should implement this method
+        and call it again when the switches have changed. It is also called at
+        the start of run() and in reset().
+        """
+        # to implement in child class
+        return
+
     def nonlinear_tendency(self) -> StateBase:
         """
         Calculate nonlinear tendency. Models do not have to implement this method. It is called in some balancing routines.
@@ -225,21 +243,40 @@ class ModelBase:
     # ============================================================
     def time_stepping(self) -> None:
         """
-        Perform Adam-Bashforth time stepping.
+        Perform Adam-Bashforth time stepping. The state is updated in-place,
+        time levels with a zero coefficient (after a restart) are skipped.
         """
+        cp = self.grid.cp
         dt = self.mset.dt
-        for i in range(self.mset.time_levels):
-            self.z += self.dz_list[self.pointer[i]] * dt * self.coeff_AB[i]
+        levels = [(self.get_dz(i).field_list, dt * self.coeff_AB[i])
+                  for i in range(self.mset.time_levels) 
+                  if self.coeff_AB[i] != 0]
+
+        for n, field in enumerate(self.z.field_list):
+            arr = field.arr
+            tmp = self.ab_tmp
+            if tmp is None or tmp.shape != arr.shape or tmp.dtype != arr.dtype:
+                tmp = self.ab_tmp = cp.empty_like(arr)
+            for dz_fields, coeff in levels:
+                cp.multiply(dz_fields[n].arr, coeff, out=tmp)
+                arr += tmp
         return
 
 
     def update_pointer(self) -> None:
         """
-        Update pointer for Adam-Bashforth time stepping.
+        Update pointer for Adam-Bashforth time stepping. The tendencies are
+        stored in a ring buffer, only the head index moves.
         """
-        self.pointer = np.roll(self.pointer, 1)
+        self.head = (self.head - 1) % self.mset.time_levels
         return
 
+    def get_dz(self, i:int) -> StateBase:
+        """
+        Returns the tendency term of i time steps ago (i=0: current).
+        """
+        return self.dz_list[(self.head + i) % self.mset.time_levels]
+
 
     def update_coeff_AB(self) -> None:
         """
@@ -247,7 +284,6 @@ class ModelBase:
         """
         # current time level (ctl)
         # maximum ctl is the number of time levels - 1
-        cp = self.grid.cp
         ctl = min(self.it, self.mset.time_levels-1)
 
         # list of Adam-Bashforth coefficients
@@ -255,7 +291,7 @@ class ModelBase:
 
         # choose Adam-Bashforth coefficients of current time level
         self.coeff_AB[:]      = 0
-        self.coeff_AB[:ctl+1] = cp.asarray(coeffs[ctl])
+        self.coeff_AB[:ctl+1] = coeffs[ctl]
         return
     
     # ============================================================
@@ -300,19 +336,37 @@ class ModelBase:
     #   Getters and setters
     # ============================================================
 
+    @property
+    def z(self):
+        """
+        Returns the current state of the model. This is the live state (no
+        copy), in-place changes of it change the state of the model.
+        """
+        return self._z
+
+    @z.setter
+    def z(self, value):
+        """
+        Set the current state of the model. The state is copied, since the 
+        time stepping updates the model state in-place (the state of the 
+        caller is not modified).
+        """
+        self._z = value.copy()
+        return
+
     @property
     def dz(self):
         """
         Returns a pointer on the current tendency term.
         """
-        return self.dz_list[self.pointer[0]]
+        return self.dz_list[self.head]
 
     @dz.setter
     def dz(self, value):
         """
         Set the current tendency term.
         """
-        self.dz_list[self.pointer[0]] = value
+        self.dz_list[self.head] = value
         return
 
     # ============================================================
@@ -331,9 +385,14 @@ class ModelBase:
         """
         self.it = 0
         self.timer.reset()
-        self.z *= 0
-        for dz in self.dz_list:
-            dz *= 0
+        self.update_tendency_modules()
+        # zero the state and the tendencies in-place
+        for z in [self._z] + self.dz_list:
+            if z.data is not None:
+                z.data[:] = 0
+            else:
+                for field in z.field_list:
+                    field.arr[:] = 0
         self.writer.reset()
         # to implement in child class
         return
@@ -347,4 +406,5 @@ class ModelBase:
 
     def show_video(self):
         if self.mset.enable_vid_anim:
+            from IPython.display import Video
             return Video(self.vid_animation.filename, width=600, embed=True) 
\ No newline at end of file
@@ -1,5 +1,6 @@
 import numpy as np
 import copy
+import math
 
 
 class ModelSettingsBase:
@@ -25,6 +26,8 @@ class ModelSettingsBase:
         snap_interval (int)    : Snapshot interval.
         diag_interval (int)    : Diagnostic interval.
         snap_filename (str)    : Snapshot filename.
+        snap_buffer_size (int) : Number of snapshots that are buffered in 
+                                 memory before they are written.
 
         enable_tqdm (bool)      : Enable progress bar.
         enable_snap (bool)      : Enable writing snapshots.
@@ -48,18 +51,20 @@ class ModelSettingsBase:
                          IPython).
     """
 
-    def __init__(self, n_dims:int, dtype=np.float64, ctype=np.complex128,
-                 **kwargs):
+    def __init__(self, n_dims:int, dtype=np.float64, ctype=None, **kwargs):
         """
         Constructor.
 
         Args:
             n_dims (int)       : Number of spatial dimensions.
             dtype (np.dtype)   : Data type for real.         
-            ctype (np.dtype)   : Data type for complex.
+            ctype (np.dtype)   : Data type for complex (None => complex type
+                                 with the precision of dtype).
         """
 
-        # variable types
+        # variable types (complex64 for float32, complex128 for float64)
+        if ctype is None:
+            ctype = np.result_type(dtype, np.complex64).type
         self.dtype = dtype
         self.ctype = ctype
 
@@ -96,6 +101,7 @@ class ModelSettingsBase:
         self.diag_interval = 200
         self.snap_filename = "snap.cdf"
         self.snap_slice    = tuple([slice(None)] * self.n_dims)
+        self.snap_buffer_size = 1
 
         # Plotting and Animation
         self.enable_live_anim  = False   # Enable live animation
@@ -203,9 +209,7 @@ class ModelSettingsBase:
     def N(self, value: list):
         self._N = [int(val) for val in value]
         self._dg = [L / N for L, N in zip(self._L, self._N)]
-        self._total_grid_points = 1
-        for n in self._N:
-            self._total_grid_points *= n
+        self._total_grid_points = math.prod(self._N)
 
     @property
     def dg(self) -> list:
@@ -46,11 +46,11 @@ class NNMDBase(Projection):
 
         # create the eigenvectors
         self.q0 = VecQ(0, mset, grid)
-        self.p0 = VecP(0, mset, grid)
+        self.p0 = VecP(0, mset, grid, q=self.q0)
         self.qp = VecQ(1, mset, grid)
-        self.pp = VecP(1, mset, grid)
+        self.pp = VecP(1, mset, grid, q=self.qp)
         self.qm = VecQ(-1, mset, grid)
-        self.pm = VecP(-1, mset, grid)
+        self.pm = VecP(-1, mset, grid, q=self.qm)
 
         self.one_over_omega = 1 / self.grid.omega_space_discrete
         # set inf to zero
@@ -325,7 +325,7 @@ class NNMDBase(Projection):
         # initialize the model
         model = self.model
         model.reset()
-        model.z = z_phys.copy()
+        model.z = z_phys
         z_next = model.step()
 
         dz = (z_next - z_phys) / model.mset.dt
@@ -3,6 +3,10 @@ import time as system_time
 import multiprocessing as mp
 from netCDF4 import Dataset
 import numpy
+try :
+    import cupyx
+except ImportError:
+    pass
 
 from fridom.Framework.ModelSettingsBase import ModelSettingsBase
 from fridom.Framework.GridBase import GridBase
@@ -18,9 +22,12 @@ class NetCDFWriter:
         parallel_writer (mp.Process): Parallel writer process.
         input_queue (mp.Queue)      : Queue to communicate with the writer.
         snap_slice (tuple)          : Slice for snapshot.
+        buffers (list)              : Host buffers of the buffered snapshots.
+        buffer_times (list)         : Model times of the buffered snapshots.
 
     Methods:
-        write_cdf: Write data to binary files and add them to the NetCDF file.
+        write_cdf: Buffer a snapshot (written when the buffer is full).
+        flush    : Write the buffered snapshots to the NetCDF file.
         close    : Close the NetCDF file.
     """
 
@@ -35,6 +42,8 @@ class NetCDFWriter:
         self.var_unit_names = None
         self.filename = os.path.join("snapshots", mset.snap_filename)
         self.is_active = False
+        self.buffers = None
+        self.buffer_times = []
         return
 
     def set_var_names(self, 
@@ -82,31 +91,66 @@ class NetCDFWriter:
                     self.binary_files))
             self.parallel_writer.start()
 
+            # the snapshot buffers are allocated with the first snapshot
+            self.buffers = None
+            self.buffer_times = []
             self.is_active = True
         return
 
 
     def write_cdf(self, variables, time):
         """
-        Write data to binary files and add them to the NetCDF file.
+        Copy the data to the snapshot buffers. When mset.snap_buffer_size
+        snapshots are buffered, they are written together.
 
         Args:
             variables (list): List of variables to write.
             time (float):   Current model time.
         """
+        sel = self.mset.snap_slice
+
+        # allocate the buffers (page-locked host memory on the GPU)
+        if self.buffers is None:
+            n_buf = self.mset.snap_buffer_size
+            empty = cupyx.empty_pinned if self.mset.gpu else numpy.empty
+            self.buffers = [
+                empty((n_buf,) + var[sel].shape, dtype=self.mset.dtype)
+                for var in variables]
+
+        # copy the data to the buffers
+        ind = len(self.buffer_times)
+        for buffer, var in zip(self.buffers, variables):
+            if self.mset.gpu:
+                var[sel].get(out=buffer[ind])
+            else:
+                buffer[ind] = var[sel]
+        self.buffer_times.append(time)
+
+        if len(self.buffer_times) >= self.mset.snap_buffer_size:
+            self.flush()
+        return
+
+    def flush(self):
+        """
+        Write the buffered snapshots to binary files and add them to the 
+        NetCDF file.
+        """
+        n_buf = len(self.buffer_times)
+        if n_buf == 0:
+            return
+
         # wait until all binary files are deleted
         for binary_file in self.binary_files:
             while os.path.exists(binary_file):
                 pass
 
         # write data to binary file
-        cp = self.grid.cp
-        binary_files = self.binary_files
-        for name, var in zip(binary_files, variables):
-            cp.save(name, var[self.mset.snap_slice])
+        for name, buffer in zip(self.binary_files, self.buffers):
+            numpy.save(name, buffer[:n_buf])
 
         # add binary file to cdf file
-        self.input_queue.put(time)
+        self.input_queue.put(self.buffer_times)
+        self.buffer_times = []
         return
 
 
@@ -115,6 +159,7 @@ class NetCDFWriter:
         Close the NetCDF file.
         """
         if self.is_active:
+            self.flush()
             self.input_queue.put("STOP")
             self.parallel_writer.join()
         self.is_active = False
@@ -216,12 +261,13 @@ def parallel_writer(mset:ModelSettingsBase, x_in, filename, input_queue,
     #  START MAIN LOOP
     # ================================================================
     while True:
-        model_time = input_queue.get()
-        if model_time == "STOP":
+        model_times = input_queue.get()
+        if isinstance(model_times, str) and model_times == "STOP":
             break
 
-        ti = time.size
-        time[ti] = model_time
+        # write all buffered snapshots at once
+        ti = time.size; n_buf = len(model_times)
+        time[ti:ti+n_buf] = model_times
 
         # wait until all files are written
         for binary_file in binary_files:
@@ -229,7 +275,10 @@ def parallel_writer(mset:ModelSettingsBase, x_in, filename, input_queue,
                 pass
 
         for var, binary_file in zip(vars, binary_files):
-            var[ti,:] = numpy.load(binary_file).T
+            data = numpy.load(binary_file)
+            # reverse the spatial axes (as for the coordinates)
+            axes = (0,) + tuple(range(data.ndim-1, 0, -1))
+            var[ti:ti+n_buf,:] = data.transpose(axes)
             os.remove(binary_file)
 
     ncfile.close()
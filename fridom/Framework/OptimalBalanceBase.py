@@ -68,6 +68,11 @@ class OptimalBalanceBase(Projection):
         # save the rossby number
         self.rossby = float(mset.Ro)
 
+        # rossby numbers of all ramping steps (evaluated once)
+        theta = np.arange(self.ramp_steps) / self.ramp_steps
+        self.ramp_forward  = self.rossby * self.ramp_func(theta)
+        self.ramp_backward = self.rossby * self.ramp_func(1 - theta)
+
         # prepare the balancing
         self.z_base = None
         return
@@ -76,40 +81,49 @@ class OptimalBalanceBase(Projection):
         self.z_base = self.base_proj(z)
         return
 
-    def forward_to_nonlinear(self, z: StateBase) -> StateBase:
+    def ramp(self, z: StateBase, forward: bool) -> StateBase:
         """
-        Perform forward ramping from linear model to nonlinear model.
+        Ramp a state with the model (shared by the ramping methods below).
 
         Arguments:
-            z      (State) : The state to ramp.
+            z       (State) : The state to ramp.
+            forward (bool)  : Ramp with the forward (True) or backward 
+                              (False) ramping table.
 
         Returns:
-            z_ramp (State) : The ramped state.
+            z_ramp (State) : The ramped state (the model state, it is 
+                             replaced by the next ramping).
         """
-
         model = self.model
-        model.reset()
         mset = model.mset
 
+        # the time step and the friction coefficients keep their sign in
+        # both directions, only the ramping of the rossby number differs
+        if forward:
+            friction = self.enable_forward_friction
+            ramp_Ro = self.ramp_forward
+        else:
+            friction = self.enable_backward_friction
+            ramp_Ro = self.ramp_backward
+
         # update model settings
-        model.mset.enable_biharmonic = self.enable_forward_friction
-        model.mset.enable_harmonic = self.enable_forward_friction
-        # make sure that the parameters are positive
-        for par in [mset.ah, mset.kh, mset.ahbi, mset.khbi, mset.dt]:
-            par = np.abs(par)
+        mset.enable_biharmonic = friction
+        mset.enable_harmonic = friction
 
-        # initialize the model
-        model.z = z.copy()
+        # initialize the model (the model copies the state)
+        model.reset()
+        model.z = z
 
-        # perform the forward ramping
-        for n in range(self.ramp_steps):
-            mset.Ro = self.rossby * self.ramp_func(n / self.ramp_steps)
-            model.step()
+        # perform the ramping
+        step = model.step
+        for Ro in ramp_Ro:
+            mset.Ro = Ro
+            step()
         return model.z
-    
-    def backward_to_linear(self, z: StateBase) -> StateBase:
+
+    def forward_to_nonlinear(self, z: StateBase) -> StateBase:
         """
-        Perform backward ramping from nonlinear model to linear model.
+        Perform forward ramping from linear model to nonlinear model.
 
         Arguments:
             z      (State) : The state to ramp.
@@ -117,25 +131,19 @@ class OptimalBalanceBase(Projection):
         Returns:
             z_ramp (State) : The ramped state.
         """
-        model = self.model
-        model.reset()
-        mset = model.mset
+        return self.ramp(z, forward=True)
 
-        # update model settings
-        model.mset.enable_biharmonic = self.enable_backward_friction
-        model.mset.enable_harmonic = self.enable_backward_friction
-        # make sure that the parameters are negative
-        for par in [mset.ah, mset.kh, mset.ahbi, mset.khbi, mset.dt]:
-            par = - np.abs(par)
+    def backward_to_linear(self, z: StateBase) -> StateBase:
+        """
+        Perform backward ramping from nonlinear model to linear model.
 
-        # initialize the model
-        model.z = z.copy()
+        Arguments:
+            z      (State) : The state to ramp.
 
-        # perform the backward ramping
-        for n in range(self.ramp_steps):
-            mset.Ro = self.rossby * self.ramp_func(1 - n / self.ramp_steps)
-            model.step()
-        return model.z
+        Returns:
+            z_ramp (State) : The ramped state.
+        """
+        return self.ramp(z, forward=False)
 
     def forward_to_linear(self, z: StateBase) -> StateBase:
         """
@@ -147,25 +155,7 @@ class OptimalBalanceBase(Projection):
         Returns:
             z_ramp (State) : The ramped state.
         """
-        model = self.model
-        model.reset()
-        mset = model.mset
-
-        # update model settings
-        model.mset.enable_biharmonic = self.enable_forward_friction
-        model.mset.enable_harmonic = self.enable_forward_friction
-        # make sure that the parameters are positive
-        for par in [mset.ah, mset.kh, mset.ahbi, mset.khbi, mset.dt]:
-            par = np.abs(par)
-
-        # initialize the model
-        model.z = z.copy()
-
-        # perform the forward ramping
-        for n in range(self.ramp_steps):
-            mset.Ro = self.rossby * self.ramp_func(n / self.ramp_steps)
-            model.step()
-        return model.z
+        return self.ramp(z, forward=True)
 
     def backward_to_nonlinear(self, z: StateBase) -> StateBase:
         """
@@ -177,32 +167,15 @@ class OptimalBalanceBase(Projection):
         Returns:
             z_ramp (State) : The ramped state.
         """
-        model = self.model
-        model.reset()
-        mset = model.mset
-
-        # update model settings
-        model.mset.enable_biharmonic = self.enable_backward_friction
-        model.mset.enable_harmonic = self.enable_backward_friction
-        # make sure that the parameters are negative
-        for par in [mset.ah, mset.kh, mset.ahbi, mset.khbi, mset.dt]:
-            par = - np.abs(par)
-
-        # initialize the model
-        model.z = z.copy()
-
-        # perform the backward ramping
-        for n in range(self.ramp_steps):
-            mset.Ro = self.rossby * self.ramp_func(1 - n / self.ramp_steps)
-            model.step()
-        return model.z
+        return self.ramp(z, forward=False)
 
     def get_ramp_func(ramp_type):
         if ramp_type == "exp":
             def ramp_func(theta):
                 t1 = 1./np.maximum(1e-32,theta )
                 t2 = 1./np.maximum(1e-32,1.-theta )
-                return np.exp(-t1)/(np.exp(-t1)+np.exp(-t2))  
+                e1 = np.exp(-t1)
+                return e1/(e1+np.exp(-t2))
         elif ramp_type == "pow":
             def ramp_func(theta):
                 return theta**3/(theta**3+(1.-theta)**3)
@@ -233,6 +206,14 @@ class OptimalBalanceBase(Projection):
         iterations = np.arange(self.max_it)
         errors     = np.ones(self.max_it)
 
+        # nothing to do without iterations (skip the base point projection)
+        if self.max_it == 0:
+            z_res = z.copy()
+            if self.return_details:
+                return z_res, iterations, errors
+            else:
+                return z_res
+
         # save the base coordinate
         self.calc_base_coord(z)
 
@@ -240,6 +221,7 @@ class OptimalBalanceBase(Projection):
 
         # start the iterations
         verbose("Starting optimal balance iterations")
+        prev_error = np.inf
 
         for it in iterations:
             verbose(f"Starting iteration {it}")
@@ -251,11 +233,20 @@ class OptimalBalanceBase(Projection):
             # forward ramping
             verbose("Performing forward ramping")
             z_bal = self.forward_to_nonlinear(z_lin)
-            # exchange base point coordinate
-            z_new = z_bal - self.base_proj(z_bal) + self.z_base
-
-            # calculate the error
-            errors[it] = error = z_new.norm_of_diff(z_res)
+            # exchange base point coordinate: z_bal - P(z_bal) + z_base
+            # (evaluated in-place in the projection, no temporary states)
+            z_new = self.base_proj(z_bal)
+            if z_new is z_bal:
+                z_new = z_bal.copy()
+            for f_new, f_bal, f_base in zip(z_new.field_list, 
+                                            z_bal.field_list, 
+                                            self.z_base.field_list):
+                z.cp.subtract(f_base.arr, f_new.arr, out=f_new.arr)
+                f_new.arr += f_bal.arr
+
+            # calculate the error (one conversion to a python float)
+            error = float(z_new.norm_of_diff(z_res))
+            errors[it] = error
 
             verbose(f"Difference to previous iteration: {error:.2e}")
 
@@ -268,9 +259,10 @@ class OptimalBalanceBase(Projection):
                 break
 
             # check if the error is increasing
-            if it > 0 and error > errors[it-1]:
+            if error > prev_error:
                 verbose("WARNING: Error is increasing. Stopping iterations.")
                 break
+            prev_error = error
 
         if self.return_details:
             return z_res, iterations, errors
@@ -45,7 +45,7 @@ class GeostrophicSpectralBase(Projection):
         super().__init__(mset, grid)
         # Construct the eigenvectors
         self.q = VecQ(0, mset, grid)
-        self.p = VecP(0, mset, grid)
+        self.p = VecP(0, mset, grid, q=self.q)
         return
 
     def __call__(self, z: StateBase) -> StateBase:
@@ -74,7 +74,7 @@ class WaveSpectralBase(Projection):
         # use that the projection on the positive and negative eigenspaces
         # are the same. Hence, we only need to construct one of them.
         self.q = VecQ(1, mset, grid)
-        self.p = VecP(1, mset, grid)
+        self.p = VecP(1, mset, grid, q=self.q)
         return
 
     def __call__(self, z: StateBase) -> StateBase:
@@ -101,7 +101,7 @@ class DivergenceSpectralBase(Projection):
         """
         super().__init__(mset, grid)
         self.q = VecQ("d", mset, grid)
-        self.p = VecP("d", mset, grid)
+        self.p = VecP("d", mset, grid, q=self.q)
 
     def __call__(self, z: StateBase) -> StateBase:
         """
@@ -195,7 +195,7 @@ class GeostrophicTimeAverageBase(Projection):
             model.mset.dt = np.abs(model.mset.dt)
             verbose(f"Averaging forward for {n_its*self.mset.dt:.2f} seconds")
             model.reset()
-            model.z = z_ave.copy()
+            model.z = z_ave
             for _ in range(n_its):
                 model.step()
                 z_ave += model.z
@@ -206,7 +206,7 @@ class GeostrophicTimeAverageBase(Projection):
                 verbose(f"Averaging backwards for {n_its*self.mset.dt:.2f} seconds")
                 model.mset.dt = - np.abs(model.mset.dt)
                 model.reset()
-                model.z = z_ave.copy()
+                model.z = z_ave
                 for _ in range(n_its):
                     model.step()
                     z_ave += model.z
@@ -14,6 +14,10 @@ class StateBase:
     """
     Base class for the state of the model, contains list of fields.
     
+    Attributes:
+        data (ndarray)   : Contiguous array that holds all fields (None if
+                           the state has no such block).
+
     Methods:
         fft              : Fourier transform of the state.
         project          : Project the state on a (spectral) vector.
@@ -42,19 +46,44 @@ class StateBase:
         self.constructor = StateBase
         self.field_list = field_list
 
-    def copy(self) -> Type["StateBase"]:
+    def copy(self, out=None) -> Type["StateBase"]:
         """
         Create a copy of the state.
+
+        Arguments:
+            out (State)  : State to copy the data into (reuses its buffers,
+                           default: None)
         """
+        if out is not None:
+            for field, field_out in zip(self.field_list, out.field_list):
+                field_out.arr[...] = field.arr
+            return out
+
         fields = [field.copy() for field in self.field_list]
         z = self.constructor(self.mset, self.grid, 
                              field_list=fields, is_spectral=self.is_spectral)
         return z
 
-    def cpu(self) -> Type["StateBase"]:
+    def __deepcopy__(self, memo) -> Type["StateBase"]:
+        """
+        Deep copy of the state (copies the field arrays, the model settings
+        and the grid are shared).
+        """
+        return self.copy()
+
+    def cpu(self, out=None) -> Type["StateBase"]:
         """
         Create a copy of the state on the CPU.
+
+        Arguments:
+            out (State)  : CPU state to copy the data into (reuses its 
+                           buffers, default: None)
         """
+        if out is not None:
+            for field, field_cpu in zip(self.field_list, out.field_list):
+                field.cpu(out=field_cpu)
+            return out
+
         fields_cpu = [field.cpu() for field in self.field_list]
         mset = fields_cpu[0].mset
         grid = fields_cpu[0].grid
@@ -62,6 +91,14 @@ class StateBase:
                                 is_spectral=self.is_spectral)
         return z
     
+    @property
+    def data(self):
+        """
+        Contiguous array that holds all fields. Child classes that store 
+        their fields in one block override this, the base class has none.
+        """
+        return None
+
     # ======================================================================
     #  BASIC OPERATIONS
     # ======================================================================
@@ -70,6 +107,26 @@ class StateBase:
         """
         Calculate the Fourier transform of the state. (forward and backward)
         """
+        data = self.data
+        if data is not None and all(self.mset.periodic_bounds):
+            # transform the contiguous block directly into the block of the
+            # new state (no padding needed, no intermediate copies)
+            cp = self.cp
+            z = self.constructor(self.mset, self.grid, 
+                                 is_spectral=not self.is_spectral)
+            if self.is_spectral:
+                transform = lambda x, axes: cp.fft.ifftn(x, axes=axes).real
+            else:
+                transform = lambda x, axes: cp.fft.fftn(x, axes=axes)
+            if self.mset.gpu:
+                # one batched transform over all fields
+                z.data[:] = transform(data, tuple(range(1, data.ndim)))
+            else:
+                # numpy does not gain from batching, transform field-wise
+                for arr, out in zip(data, z.data):
+                    out[:] = transform(arr, None)
+            return z
+
         fields_fft = [field.fft() for field in self.field_list]
         z = self.constructor(
             self.mset, self.grid, field_list=fields_fft, 
@@ -109,10 +166,14 @@ class StateBase:
         my_fields = self.field_list
         other_fields = other.field_list
         result = my_fields[0] * other_fields[0].conj()
-        if len(my_fields) > 1:
-            for i in range(1, len(my_fields)):
-                result += my_fields[i] * other_fields[i].conj()
-        
+        # accumulate the remaining products in-place (one scratch buffer)
+        cp = self.cp
+        tmp = cp.empty_like(result.arr)
+        for f1, f2 in zip(my_fields[1:], other_fields[1:]):
+            cp.conj(f2.arr, out=tmp)
+            tmp *= f1.arr
+            result.arr += tmp
+
         return result
 
     def norm_l2(self) -> float:
@@ -122,7 +183,10 @@ class StateBase:
         Returns:
             norm (float)  : L2 norm of the state.
         """
-        return self.cp.mean(self.dot(self))
+        # sum of the field-wise reductions (no temporary dot product field)
+        total = sum(self.cp.vdot(field.arr, field.arr) 
+                    for field in self.field_list)
+        return total / self.field_list[0].arr.size
 
     def norm_of_diff(self, other:Type["StateBase"]) -> float:
         """
@@ -1,4 +1,4 @@
-from time import time
+from time import perf_counter
 
 
 class TimingComponent:
@@ -35,7 +35,7 @@ class TimingComponent:
             raise RuntimeError(f"TimingComponent {self.name} is already active.")
         # start the timer
         self.is_active = True
-        self.start_time = time()
+        self.start_time = perf_counter()
         return
 
     def stop(self) -> None:
@@ -46,7 +46,7 @@ class TimingComponent:
         if not self.is_active:
             raise RuntimeError(f"TimingComponent {self.name} is not active.")
         # stop the timer
-        self.time += time() - self.start_time
+        self.time += perf_counter() - self.start_time
         self.is_active = False
         return
     
@@ -97,17 +97,25 @@ class TimingModule:
         self.components = [
             self.total,
         ]
+        # name -> component (for fast lookup in get)
+        self.by_name = {self.total.name: self.total}
         return
 
-    def add_component(self, name:str) -> None:
+    def add_component(self, name:str) -> TimingComponent:
         """
         Add a new TimingComponent to the TimingModule.
 
         Arguments:
             name (str): name of the new component
+
+        Returns:
+            component (TimingComponent): the component returned by get(name)
+                                         (can be stored to avoid the lookup)
         """
-        self.components.append(TimingComponent(name))
-        return
+        component = TimingComponent(name)
+        self.components.append(component)
+        # the first component with a given name is the one returned by get
+        return self.by_name.setdefault(name, component)
     
     def get(self, name:str) -> TimingComponent:
         """
@@ -117,11 +125,11 @@ class TimingModule:
             name (str): name of the component to get
         """
         # search for component with given name
-        for component in self.components:
-            if component.name == name:
-                return component
+        component = self.by_name.get(name)
         # raise error if not found
-        raise RuntimeError(f"TimingComponent {name} not found.")
+        if component is None:
+            raise RuntimeError(f"TimingComponent {name} not found.")
+        return component
 
     def reset(self) -> None:
         """
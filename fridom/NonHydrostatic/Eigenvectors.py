@@ -92,7 +92,7 @@ class VecP(State):
     See the documentation for more details.
     """
 
-    def __init__(self, s, mset:ModelSettings, grid=Grid) -> None:
+    def __init__(self, s, mset:ModelSettings, grid=Grid, q=None) -> None:
         """
         Constructor of the projector on the discrete eigenvectors.
         
@@ -104,6 +104,8 @@ class VecP(State):
                     -1  => negative inertial-gravity)
             mset: The ModelSettings object.
             grid: The Grid object.
+            q   : The eigenvector VecQ(s, mset, grid) if it is already
+                  constructed (default: None => constructed here).
         """
         super().__init__(mset, grid, is_spectral=True)
 
@@ -132,7 +134,8 @@ class VecP(State):
         g = (kx**2 + ky**2 != 0)
 
         # Construct the eigenvector
-        q = VecQ(s, mset, grid)
+        if q is None:
+            q = VecQ(s, mset, grid)
         self.u = q.u.copy(); self.v = q.v.copy() 
         self.w = q.w.copy(); self.b = q.b.copy()
 
@@ -167,18 +170,13 @@ class VecP(State):
 
         # normalize the vector
         norm = cp.abs(q.dot(self))
-        # avoid division by zero
+        # avoid division by zero (set to zero where the norm is zero)
         mask = (norm > 1e-10)
-        self.u[mask] /= norm[mask]
-        self.v[mask] /= norm[mask]
-        self.w[mask] /= norm[mask]
-        self.b[mask] /= norm[mask]
-        # set to zero where the norm is zero
-        zero_mask = (norm <= 1e-10)
-        self.u[zero_mask] *= 0
-        self.v[zero_mask] *= 0
-        self.w[zero_mask] *= 0
-        self.b[zero_mask] *= 0
+        inv_norm = cp.where(mask, 1 / cp.where(mask, norm, 1), 0)
+        self.u *= inv_norm
+        self.v *= inv_norm
+        self.w *= inv_norm
+        self.b *= inv_norm
 
 
 class VecQAnalytical(State):
@@ -122,12 +122,13 @@ class BaroclinicJet(State):
         super().__init__(mset, grid)
         cp = self.cp
 
-        X  = grid.X[0]; Y  = grid.X[1]; Z  = grid.X[2]
+        x  = grid.x[0]; y  = grid.x[1]; z  = grid.x[2]
         Lx = mset.L[0]; Ly = mset.L[1]; Lz = mset.L[2]
 
-        # two opposite jets
-        self.u[:] = jet_strength * cp.cos(2*cp.pi*Z/Lz)
-        self.u[:] *= cp.exp(-(Y-Ly/2)**2/(2*(0.15*Ly)**2))
+        # two opposite jets (1D profiles, broadcasted in one assignment)
+        jet_z = jet_strength * cp.cos(2*cp.pi*z/Lz)
+        jet_y = cp.exp(-(y-Ly/2)**2/(2*(0.15*Ly)**2))
+        self.u[:] = jet_y[None, :, None] * jet_z[None, None, :]
         
 
 
@@ -138,7 +139,8 @@ class BaroclinicJet(State):
         self.w[:] = z_geo.w; self.b[:] = z_geo.b
 
         # add a small perturbation
-        self.w[:] = pert_strength * cp.sin(pert_wavenum*2*cp.pi*X/Lx)
+        pert_x = pert_strength * cp.sin(pert_wavenum*2*cp.pi*x/Lx)
+        self.w[:] = pert_x[:, None, None]
         return
 
 
@@ -306,30 +308,44 @@ class WavePackage(State):
             self.omega = z.omega
             self.period = z.period
 
-        # Construct mask
-        mask = cp.ones_like(grid.X[0])
-        for x, pos, width in zip(grid.X, mask_pos, mask_width):
+        # Construct mask from 1D gaussians along each axis (exp is only 
+        # evaluated on the 1D coordinates, the full mask is broadcasted)
+        mask = None
+        for i, (x, pos, width) in enumerate(zip(grid.x, mask_pos, mask_width)):
             if pos is not None and width is not None:
-                mask *= cp.exp(-(x - pos)**2 / width**2)
-
-        z.u *= mask
-        z.v *= mask
-        z.w *= mask
-        z.b *= mask
+                # gauss = exp(-((x - pos) / width)**2) in one buffer
+                gauss = x - pos
+                gauss /= width; gauss *= gauss; gauss *= -1
+                cp.exp(gauss, out=gauss)
+                shape = [1] * mset.n_dims; shape[i] = -1
+                gauss = gauss.reshape(shape)
+                mask = gauss if mask is None else mask * gauss
+
+        # apply the mask in-place to all fields (in one pass if possible,
+        # nothing to do if no axis is masked)
+        data = z.data
+        if mask is None:
+            pass
+        elif data is not None:
+            data *= mask
+        else:
+            for field in z.field_list:
+                field.arr *= mask
 
         # Project onto the mode again
         q = VecQ(s, mset, grid)
-        p = VecP(s, mset, grid)
+        p = VecP(s, mset, grid, q=q)
 
         z = z.project(p, q)
 
-        if not s == 0:
-            z *= 2
-
         # save the state
         self.u[:] = z.u; self.v[:] = z.v
         self.w[:] = z.w; self.b[:] = z.b
 
+        if not s == 0:
+            data = self.data
+            data *= 2
+
         return
 
 
@@ -41,11 +41,10 @@ class Model(ModelBase):
         super().__init__(mset, grid, State)
         self.mset = mset
 
-        # Add pressure and divergence variables
+        # Add pressure variable (the divergence is owned by the solver)
         self.p = FieldVariable(mset, grid, 
                     name="Pressure p", bc=PBoundary(mset))
-        self.div = FieldVariable(mset, grid,
-                    name="Divergence", bc=PBoundary(mset))
+        self.vid_p = None     # reusable CPU buffer of the pressure (video)
         
         # Modules
         self.linear_tendency     = LinearTendency(mset, grid, self.timer)
@@ -57,7 +56,7 @@ class Model(ModelBase):
         self.biharmonic_friction = BiharmonicFriction(mset, grid, self.timer)
         self.biharmonic_mixing   = BiharmonicMixing(mset, grid, self.timer)
         self.source_tendency     = SourceTendency(mset, grid, self.timer)
-
+        self.update_tendency_modules()
 
         # netcdf writer
         var_names = ["u", "v", "w", "b", "p"]
@@ -72,26 +71,54 @@ class Model(ModelBase):
     #   TOTAL TENDENCY
     # ============================================================
 
-    def total_tendency(self):
-        
-        # calculate linear tendency
-        self.linear_tendency(self.z, self.dz)
+    def tendency_switches(self) -> tuple:
+        """
+        The switches of the model settings that select the tendency modules.
+        """
+        mset = self.mset
+        return (mset.enable_nonlinear, mset.enable_harmonic, 
+                mset.enable_biharmonic, mset.enable_source)
+
+    def update_tendency_modules(self) -> None:
+        """
+        Collect the tendency modules that are enabled in the model settings.
+        """
+        mset = self.mset
+        self.switches = self.tendency_switches()
 
-        # calculate nonlinear tendency
-        if self.mset.enable_nonlinear:
-            self.nonlinear_tendency(self.z, self.dz)
+        # linear tendency
+        modules = [self.linear_tendency]
+
+        # nonlinear tendency
+        if mset.enable_nonlinear:
+            modules.append(self.nonlinear_tendency)
 
         # Friction And Mixing
-        if self.mset.enable_harmonic:
-            self.harmonic_friction(self.z, self.dz)
-            self.harmonic_mixing(self.z, self.dz)
+        if mset.enable_harmonic:
+            modules.append(self.harmonic_friction)
+            modules.append(self.harmonic_mixing)
+
+        if mset.enable_biharmonic:
+            modules.append(self.biharmonic_friction)
+            modules.append(self.biharmonic_mixing)
+
+        self.tendency_modules = modules
+        self.source_enabled = mset.enable_source
+        return
+
+    def total_tendency(self):
+        # rebuild the module list when a switch has been changed
+        if self.tendency_switches() != self.switches:
+            self.update_tendency_modules()
+
+        z = self.z; dz = self.dz
 
-        if self.mset.enable_biharmonic:
-            self.biharmonic_friction(self.z, self.dz)
-            self.biharmonic_mixing(self.z, self.dz)
+        # calculate all enabled tendency terms
+        for module in self.tendency_modules:
+            module(z, dz)
 
-        if self.mset.enable_source:
-            self.source_tendency(self.dz, self.time)
+        if self.source_enabled:
+            self.source_tendency(dz, self.time)
 
         # solve for pressure
         self.pressure_solver(self.dz, self.p)
@@ -110,7 +137,7 @@ class Model(ModelBase):
         Reset the model (pointers, tendencies).
         """
         super().reset()
-        self.p = self.p*0
+        self.p[:] = 0
         return
 
 
@@ -118,12 +145,13 @@ class Model(ModelBase):
         """
         Print diagnostic information.
         """
+        mke, mpe, mte, cfl_h, cfl_v = self.z.diagnostic_bundle()
         out = "Diagnostic at t = {:.2f}\n".format(self.it * self.mset.dt)
-        out += "MKE = {:.2e},    ".format(self.z.mean_ekin())
-        out += "MPE = {:.2e},    ".format(self.z.mean_epot())
-        out += "MTE = {:.2e}\n".format(self.z.mean_etot())
-        out += "hor. CFL = {:.2f},           ".format(self.z.max_cfl_h())
-        out += "vert. CFL = {:.2f}".format(self.z.max_cfl_v())
+        out += "MKE = {:.2e},    ".format(mke)
+        out += "MPE = {:.2e},    ".format(mpe)
+        out += "MTE = {:.2e}\n".format(mte)
+        out += "hor. CFL = {:.2f},           ".format(cfl_h)
+        out += "vert. CFL = {:.2f}".format(cfl_v)
         print(out)
         return
 
@@ -135,4 +163,8 @@ class Model(ModelBase):
         return
     
     def update_vid_animation(self):
-        self.vid_animation.update(z=self.z.cpu(), p=self.p.cpu(), time=self.time)
+        # copy into the CPU buffers of the last frame (the video animation
+        # copies the data when the frame is queued)
+        self.vid_z = self.z.cpu(out=self.vid_z)
+        self.vid_p = self.p.cpu(out=self.vid_p)
+        self.vid_animation.update(z=self.vid_z, p=self.vid_p, time=self.time)
@@ -62,14 +62,19 @@ class ModelSettings(ModelSettingsBase):
         pressure_solver (str)   : Choose from "Spectral" or "CG".
         max_cg_iter (int)       : Maximum number of CG iterations.
         cg_tol (float)          : CG tolerance.
+        cg_precondition (bool)  : Use the spectral preconditioner in the CG.
+        pressure_dtype (np.dtype): Data type of the CG iterations (e.g. 
+                                  np.float32 for mixed precision with 
+                                  iterative refinement). None => dtype.
     """
-    def __init__(self, dtype=np.float64, ctype=np.complex128, **kwargs):
+    def __init__(self, dtype=np.float64, ctype=None, **kwargs):
         """
         Constructor.
 
         Args:
             dtype (np.dtype)   : Data type for real.         
-            ctype (np.dtype)   : Data type for complex.
+            ctype (np.dtype)   : Data type for complex (None => complex type
+                                 with the precision of dtype).
         """
 
         # physical parameters
@@ -104,6 +109,8 @@ class ModelSettings(ModelSettingsBase):
         self.pressure_solver   = "Spectral" # Choose from "Spectral" or "CG"
         self.max_cg_iter       = None
         self.cg_tol            = 1e-10      # Conjugate gradient tolerance
+        self.cg_precondition   = False      # Spectral CG preconditioner
+        self.pressure_dtype    = None       # CG data type (None => dtype)
 
         # init function must be called after all new variables are set
         super().__init__(n_dims=3, dtype=dtype, ctype=ctype, **kwargs)
@@ -155,6 +162,8 @@ class ModelSettings(ModelSettingsBase):
         res += "    pressure_solver = {}\n".format(self.pressure_solver)
         res += "    max_cg_iter     = {}\n".format(self.max_cg_iter)
         res += "    cg_tol          = {}\n".format(self.cg_tol)
+        res += "    cg_precondition = {}\n".format(self.cg_precondition)
+        res += "    pressure_dtype  = {}\n".format(self.pressure_dtype)
         res += "  Switches:\n"
         res += "    enable_nonlinear  = {}\n".format(self.enable_nonlinear)
         res += "    enable_varying_N  = {}\n".format(self.enable_varying_N)
@@ -185,11 +194,7 @@ class ModelSettings(ModelSettingsBase):
     
     @N.setter
     def N(self, value: list):
-        self._N = [int(val) for val in value]
-        self._dg = [L / N for L, N in zip(self._L, self._N)]
-        self._total_grid_points = 1
-        for n in self._N:
-            self._total_grid_points *= n
+        ModelSettingsBase.N.fset(self, value)
         self.max_cg_iter = max(self._N)
     
     @property
@@ -25,7 +25,7 @@ class BiharmonicFriction:
         self.dz2 = mset.dtype(1.0) / mset.dz**2
 
         # add a timer
-        self.timer.add_component('Biharmonic Friction')
+        self.timing = self.timer.add_component('Biharmonic Friction')
 
     def __call__(self, z: State, dz:State):
         """
@@ -36,7 +36,7 @@ class BiharmonicFriction:
             dz (State) : Tendency of the state.
         """
         # start the timer
-        self.timer.get("Biharmonic Friction").start()
+        self.timing.start()
 
         # compute the biharmonic friction tendency
         # shorthand notation
@@ -89,6 +89,6 @@ class BiharmonicFriction:
         dz.w[:] -= biharmonic_function(z.w, ahbi, avbi)
 
         # stop the timer
-        self.timer.get("Biharmonic Friction").stop()
+        self.timing.stop()
 
         return 
\ No newline at end of file
@@ -25,7 +25,7 @@ class BiharmonicMixing:
         self.dz2 = mset.dtype(1.0) / mset.dz**2
 
         # add a timer
-        self.timer.add_component('Biharmonic Mixing')
+        self.timing = self.timer.add_component('Biharmonic Mixing')
 
     def __call__(self, z: State, dz:State):
         """
@@ -36,7 +36,7 @@ class BiharmonicMixing:
             dz (State) : Tendency of the state.
         """
         # start the timer
-        self.timer.get("Biharmonic Mixing").start()
+        self.timing.start()
 
         # compute the biharmonic mixing tendency
         # shorthand notation
@@ -87,6 +87,6 @@ class BiharmonicMixing:
         dz.b[:] -= biharmonic_function(z.b, khbi, kvbi)
 
         # stop the timer
-        self.timer.get("Biharmonic Mixing").stop()
+        self.timing.stop()
 
         return 
\ No newline at end of file
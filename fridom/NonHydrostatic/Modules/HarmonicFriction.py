@@ -2,6 +2,7 @@ from fridom.NonHydrostatic.ModelSettings import ModelSettings
 from fridom.NonHydrostatic.Grid import Grid
 from fridom.NonHydrostatic.State import State
 from fridom.Framework.TimingModule import TimingModule
+from fridom.NonHydrostatic.Modules.HarmonicFunction import harmonic_function
 
 
 class HarmonicFriction:
@@ -21,7 +22,7 @@ class HarmonicFriction:
         self.timer = timer
 
         # add a timer
-        self.timer.add_component('Harmonic Friction')
+        self.timing = self.timer.add_component('Harmonic Friction')
 
     def __call__(self, z: State, dz:State):
         """
@@ -32,18 +33,17 @@ class HarmonicFriction:
             dz (State) : Tendency of the state.
         """
         # start the timer
-        self.timer.get("Harmonic Friction").start()
+        self.timing.start()
 
         # compute the harmonic friction tendency
-        u = z.u; v = z.v; w = z.w
         ah = self.mset.ah; av = self.mset.av; 
 
         # [TODO] boundary conditions
-        dz.u += (u.diff_2(0) + u.diff_2(1))*ah + u.diff_2(2)*av
-        dz.v += (v.diff_2(0) + v.diff_2(1))*ah + v.diff_2(2)*av
-        dz.w += (w.diff_2(0) + w.diff_2(1))*ah + w.diff_2(2)*av
+        dz.u[:] += harmonic_function(z.u, ah, av, self.mset, self.grid)
+        dz.v[:] += harmonic_function(z.v, ah, av, self.mset, self.grid)
+        dz.w[:] += harmonic_function(z.w, ah, av, self.mset, self.grid)
 
         # stop the timer
-        self.timer.get("Harmonic Friction").stop()
+        self.timing.stop()
 
-        return 
\ No newline at end of file
+        return
@@ -0,0 +1,47 @@
+from fridom.NonHydrostatic.ModelSettings import ModelSettings
+from fridom.NonHydrostatic.Grid import Grid
+
+
+def harmonic_function(p, h_coeff, v_coeff, mset: ModelSettings, grid: Grid):
+    """
+    Calculate harmonic friction / mixing (shared by the harmonic friction
+    and mixing modules). The field is padded only once for all three 
+    directions.
+
+    Args:
+        p (FieldVariable)      : Field variable.
+        h_coeff (float)        : Horizontal coefficient.
+        v_coeff (float)        : Vertical coefficient.
+        mset (ModelSettings)   : ModelSettings object.
+        grid (Grid)            : Grid object.
+
+    Returns:
+        res (ndarray)          : Harmonic friction / mixing.
+    """
+    # shorthand notation
+    dx2 = mset.dtype(1.0) / mset.dx**2
+    dy2 = mset.dtype(1.0) / mset.dy**2
+    dz2 = mset.dtype(1.0) / mset.dz**2
+
+    # Slices
+    c = slice(1,-1); f = slice(2,None); b = slice(None,-2)
+    xf = (f,c,c); xb = (b,c,c)
+    yf = (c,f,c); yb = (c,b,c)
+    zf = (c,c,f); zb = (c,c,b)
+    cc = (c,c,c)
+
+    # Padding with periodic boundary conditions
+    p = grid.cp.pad(p, ((1,1), (1,1), (1,1)), 'wrap')
+
+    # Apply boundary conditions
+    if not mset.periodic_bounds[0]:
+        p[0,:,:] = 0; p[-1,:,:] = 0
+    if not mset.periodic_bounds[1]:
+        p[:,0,:] = 0; p[:,-1,:] = 0
+    if not mset.periodic_bounds[2]:
+        p[:,:,0] = 0; p[:,:,-1] = 0
+
+    res = ((p[xf] - 2*p[cc] + p[xb])*dx2 + 
+           (p[yf] - 2*p[cc] + p[yb])*dy2 )*h_coeff + \
+           (p[zf] - 2*p[cc] + p[zb])*dz2*v_coeff
+    return res
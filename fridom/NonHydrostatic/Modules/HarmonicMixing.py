@@ -2,6 +2,7 @@ from fridom.NonHydrostatic.ModelSettings import ModelSettings
 from fridom.NonHydrostatic.Grid import Grid
 from fridom.NonHydrostatic.State import State
 from fridom.Framework.TimingModule import TimingModule
+from fridom.NonHydrostatic.Modules.HarmonicFunction import harmonic_function
 
 
 class HarmonicMixing:
@@ -21,7 +22,7 @@ class HarmonicMixing:
         self.timer = timer
 
         # add a timer
-        self.timer.add_component('Harmonic Mixing')
+        self.timing = self.timer.add_component('Harmonic Mixing')
 
     def __call__(self, z: State, dz:State):
         """
@@ -32,16 +33,15 @@ class HarmonicMixing:
             dz (State) : Tendency of the state.
         """
         # start the timer
-        self.timer.get("Harmonic Mixing").start()
+        self.timing.start()
 
-        # compute the harmonic friction tendency
-        b = z.b
+        # compute the harmonic mixing tendency
         kh = self.mset.kh; kv = self.mset.kv; 
 
         # [TODO] boundary conditions
-        dz.b += (b.diff_2(0) + b.diff_2(1))*kh + b.diff_2(2)*kv
+        dz.b[:] += harmonic_function(z.b, kh, kv, self.mset, self.grid)
 
         # stop the timer
-        self.timer.get("Harmonic Mixing").stop()
+        self.timing.stop()
 
-        return 
\ No newline at end of file
+        return
@@ -24,7 +24,7 @@ class LinearTendency:
         self.half = mset.dtype(0.5)
 
         # add a timer for the linear tendency
-        self.timer.add_component('Linear Tendency')
+        self.timing = self.timer.add_component('Linear Tendency')
 
     def __call__(self, z: State, dz: State) -> None:
         """
@@ -35,7 +35,7 @@ class LinearTendency:
             dz (State) : Linear tendency of the state.
         """
         # start the timer
-        self.timer.get("Linear Tendency").start()
+        self.timing.start()
 
         # compute the linear tendency
         u = z.u; v = z.v; w = z.w; b = z.b
@@ -57,14 +57,23 @@ class LinearTendency:
         q = self.quarter  # 0.25
         h = self.half     # 0.5
 
+        # the tendencies are accumulated in-place in the arrays of dz
+        # (no temporary arrays for the sums)
+        du = dz.u.arr; dv = dz.v.arr; dw = dz.w.arr; db = dz.b.arr
+
         # calculate u-tendency
-        dz.u[:] = (vp[f,f] + vp[f,b] + vp[b,f] + vp[b,b]) * q * f_cor
+        cp.add(vp[f,f], vp[f,b], out=du)
+        du += vp[b,f]; du += vp[b,b]
+        du *= q * f_cor
 
         # calculate v-tendency
-        dz.v[:] = (up[f,f] + up[f,b] + up[b,f] + up[b,b]) * q * (-f_cor)
+        cp.add(up[f,f], up[f,b], out=dv)
+        dv += up[b,f]; dv += up[b,b]
+        dv *= q * (-f_cor)
 
         # calculate w-tendency
-        dz.w[:] = (bp[:,:,f] + bp[:,:,b]) * h / dsqr
+        cp.add(bp[:,:,f], bp[:,:,b], out=dw)
+        dw *= h / dsqr
         
         # apply boundary conditions
         if not self.mset.periodic_bounds[0]:
@@ -75,9 +84,10 @@ class LinearTendency:
             dz.w[:,:,-1] = 0
 
         # calculate b-tendency
-        dz.b[:] = - (wp[:,:,f] + wp[:,:,b]) * h * N2
+        cp.add(wp[:,:,f], wp[:,:,b], out=db)
+        db *= - h * N2
 
         # stop the timer
-        self.timer.get("Linear Tendency").stop()
+        self.timing.stop()
 
         return
\ No newline at end of file
@@ -26,7 +26,7 @@ class NonlinearTendency:
         self.dz1 = mset.dtype(1.0) / mset.dz
 
         # add a timer
-        self.timer.add_component('Nonlinear Tendency')
+        self.timing = self.timer.add_component('Nonlinear Tendency')
 
     def __call__(self, z: State, dz: State) -> None:
         """
@@ -37,7 +37,7 @@ class NonlinearTendency:
             dz (State) : Nonlinear tendency of the state.
         """
         # start the timer
-        self.timer.get("Nonlinear Tendency").start()
+        self.timing.start()
 
         # compute the nonlinear tendency
 
@@ -88,18 +88,22 @@ class NonlinearTendency:
             fn = (v[cc] + v[slice]) * (p[cc] + p[yf]) * quarter
             ft = (w[cc] + w[slice]) * (p[cc] + p[zf]) * quarter
 
-            res = (fe[cc] - fe[xb])*dx1 + \
-                  (fn[cc] - fn[yb])*dy1 + \
-                  (ft[cc] - ft[zb])*dz1
+            # accumulate the divergence in-place (scaled with Ro)
+            res = fe[cc] - fe[xb]
+            res *= dx1
+            res += (fn[cc] - fn[yb])*dy1
+            res += (ft[cc] - ft[zb])*dz1
+            res *= Ro
             return res
 
         # calculate nonlinear tendency
-        dz.u[:] -= flux_divergence(u, xf) * self.mset.Ro
-        dz.v[:] -= flux_divergence(v, yf) * self.mset.Ro
-        dz.w[:] -= flux_divergence(w, zf) * self.mset.Ro
-        dz.b[:] -= flux_divergence(bu, cc) * self.mset.Ro
+        Ro = self.mset.Ro
+        dz.u.arr -= flux_divergence(u, xf)
+        dz.v.arr -= flux_divergence(v, yf)
+        dz.w.arr -= flux_divergence(w, zf)
+        dz.b.arr -= flux_divergence(bu, cc)
 
         # stop the timer
-        self.timer.get("Nonlinear Tendency").stop()
+        self.timing.stop()
 
         return 
\ No newline at end of file
@@ -26,7 +26,7 @@ class PressureGradientTendency:
         self.dz1 = mset.dtype(1.0) / mset.dz
 
         # add a timer
-        self.timer.add_component('Pressure Gradient')
+        self.timing = self.timer.add_component('Pressure Gradient')
 
     def __call__(self, p: FieldVariable, dz: State) -> None:
         """
@@ -37,7 +37,7 @@ class PressureGradientTendency:
             dz (State)        : State tendency
         """
         # start the timer
-        self.timer.get("Pressure Gradient").start()
+        self.timing.start()
 
         cp = dz.cp
         p_pad = cp.pad(p, ((0,1), (0,1), (0,1)), 'wrap')
@@ -62,5 +62,5 @@ class PressureGradientTendency:
             dz.w[:,:,-1] = 0
 
         # stop the timer
-        self.timer.get("Pressure Gradient").stop()
+        self.timing.stop()
         return
\ No newline at end of file
@@ -1,3 +1,5 @@
+import numpy
+
 from fridom.NonHydrostatic.ModelSettings import ModelSettings
 from fridom.NonHydrostatic.Grid import Grid
 from fridom.NonHydrostatic.State import State
@@ -39,7 +41,7 @@ class PressureSolve:
                 "Unknown pressure solver: {}".format(mset.pressure_solver))
 
         # add a timer
-        self.timer.add_component('Pressure Solve')
+        self.timing = self.timer.add_component('Pressure Solve')
 
     def __call__(self, dz:State, p:FieldVariable):
         """
@@ -50,7 +52,7 @@ class PressureSolve:
             p (FieldVariable) : Pressure field.
         """
         # start the timer
-        self.timer.get("Pressure Solve").start()
+        self.timing.start()
 
         cp = self.grid.cp
 
@@ -80,7 +82,7 @@ class PressureSolve:
         self.solve_for_pressure(self.div, p)
 
         # stop the timer
-        self.timer.get("Pressure Solve").stop()
+        self.timing.stop()
         return 
 
 
@@ -98,56 +100,228 @@ class SpectralSolver:
 
 
 class CGSolver:
+    """
+    Matrix-free conjugate gradient solver for the pressure. The Laplacian
+    is applied with one padded copy of the search direction, all vector
+    updates are done in-place in preallocated buffers. The mean of the
+    divergence is in the null space of the Laplacian and is removed from
+    the residual (as in the spectral solver).
+
+    If mset.pressure_dtype is set to a lower precision than mset.dtype 
+    (e.g. np.float32), the CG iterations run in that precision and the
+    solution is corrected with iterative refinement of the residual in 
+    full precision.
+
+    If mset.cg_precondition is True, the residual is preconditioned. On
+    fully periodic grids, the preconditioner is the FFT based inverse of 
+    the discrete Laplacian. The spectral grid (grid.k2_hat) is padded along
+    non-periodic axes, hence for grids with non-periodic bounds a line 
+    solve in z is used instead: the z-part of the Laplacian plus the 
+    diagonal of its horizontal part is inverted along every z-column 
+    (with a 1D FFT in z, the Laplacian of the CG wraps in every direction).
+    """
+    # maximum number of iterative refinement steps (mixed precision)
+    max_refine = 10
+
     def __init__(self, mset: ModelSettings, grid:Grid):
         self.mset = mset
         self.grid = grid
 
-        # Create a function to solve for pressure
-        if self.mset.gpu:
-            from cupyx.scipy.sparse.linalg import cg, LinearOperator
+        # shorthand notation
+        self.dx2 = mset.dtype(1.0) / mset.dx**2
+        self.dy2 = mset.dtype(1.0) / mset.dy**2
+        self.dz2 = mset.dtype(1.0) / mset.dz**2 / mset.dsqr
+
+        # preconditioner
+        self.precondition = mset.cg_precondition
+        self.line_precondition = (self.precondition and 
+                                  not all(mset.periodic_bounds))
+        if self.line_precondition:
+            # line solve in z: inverse of the z-laplacian plus the diagonal
+            # of the horizontal laplacian (never zero)
+            cp = grid.cp
+            Nz = mset.N[2]
+            kz = 2 * numpy.pi * cp.fft.fftfreq(Nz, mset.dz)
+            lam = (-2 * (self.dx2 + self.dy2) 
+                   - 2 * (1 - cp.cos(kz * mset.dz)) * self.dz2)
+            self.inv_line = (1 / lam)[None, None, :]
+        elif self.precondition:
+            # spectral preconditioner: inverse of the discrete laplacian
+            inv_k2 = - 1 / grid.k2_hat
+            inv_k2[grid.k2_hat_zero] = 0
+            self.inv_k2 = inv_k2
+
+        # work arrays of the cg iteration
+        self.work = self.allocate_work(mset.dtype)
+
+        # mixed precision
+        low_dtype = mset.pressure_dtype or mset.dtype
+        self.mixed_precision = (numpy.dtype(low_dtype) != 
+                                numpy.dtype(mset.dtype))
+        if self.mixed_precision:
+            self.work_low = self.allocate_work(low_dtype)
+            self.r_low = self.grid.cp.zeros(tuple(mset.N), dtype=low_dtype)
+            self.e_low = self.grid.cp.zeros(tuple(mset.N), dtype=low_dtype)
+            # the low precision can't reach a smaller relative residual
+            self.low_tol = max(mset.cg_tol, 10 * numpy.finfo(low_dtype).eps)
+        return
+
+    def allocate_work(self, dtype) -> tuple:
+        """
+        Allocate the work arrays of the cg iteration.
+
+        Args:
+            dtype (np.dtype) : Data type of the arrays.
+
+        Returns:
+            r, d, Ad, tmp, s : Residual, search direction, laplace of the 
+                               search direction, a scratch array, and the
+                               preconditioned residual (same as r if no 
+                               preconditioner is used).
+        """
+        cp = self.grid.cp
+        shape = tuple(self.mset.N)
+        work = [cp.zeros(shape, dtype=dtype) for _ in range(4)]
+        if self.precondition:
+            work.append(cp.zeros(shape, dtype=dtype))
         else:
-            from scipy.sparse.linalg import cg, LinearOperator
+            work.append(work[0])
+        return tuple(work)
 
-        self.cg = cg
-        
-        # shorthand notation
-        Nx  = self.mset.N[0]; Ny  = self.mset.N[1]; Nz  = self.mset.N[2]
-        dx2 = mset.dtype(1.0) / mset.dx**2
-        dy2 = mset.dtype(1.0) / mset.dy**2
-        dz2 = mset.dtype(1.0) / mset.dz**2
-        NxNyNz = self.mset.total_grid_points
-        dsqr   = self.mset.dsqr
-        cp     = self.grid.cp
-
-        # define linear operator
-        def laplace(p):
-            p = p.reshape(Nx,Ny,Nz)
-            p_pad = cp.pad(p, ((1,1),(1,1),(1,1)), "wrap")
-
-            f = slice(2,None); b = slice(None,-2); c = slice(1,-1)
-            xb = (b,c,c); xf = (f,c,c); xc = (c,c,c)
-            yb = (c,b,c); yf = (c,f,c); yc = (c,c,c)
-            zb = (c,c,b); zf = (c,c,f); zc = (c,c,c)
-
-            p_laplace = ((p_pad[xf] -2*p_pad[xc] + p_pad[xb]) * dx2 +
-                        (p_pad[yf] -2*p_pad[yc] + p_pad[yb]) * dy2 +
-                        (p_pad[zf] -2*p_pad[zc] + p_pad[zb]) * dz2 / dsqr )
-            return p_laplace.reshape(-1)
-
-        self.A = LinearOperator((NxNyNz, NxNyNz), matvec=laplace)
+    def apply_preconditioner(self, r, out):
+        """
+        Apply the preconditioner (spectral or line solve) to the residual r.
+
+        Args:
+            r (ndarray)   : Residual.
+            out (ndarray) : Output array (nothing to do if out is r).
+        """
+        if out is r:
+            return
+        cp = self.grid.cp
+        if self.line_precondition:
+            r_hat = cp.fft.fft(r, axis=2)
+            r_hat *= self.inv_line
+            out[:] = cp.fft.ifft(r_hat, axis=2).real
+            return
+        r_hat = cp.fft.fftn(r)
+        r_hat *= self.inv_k2
+        out[:] = cp.fft.ifftn(r_hat).real
+        return
+
+    def laplace(self, p, out, tmp):
+        """
+        Apply the discrete Laplacian (periodic) to p and store it in out.
+
+        Args:
+            p (ndarray)   : Input array.
+            out (ndarray) : Output array.
+            tmp (ndarray) : Scratch array.
+        """
+        cp = self.grid.cp
+        p_pad = cp.pad(p, ((1,1),(1,1),(1,1)), "wrap")
+
+        f = slice(2,None); b = slice(None,-2); c = slice(1,-1)
+        xb = (b,c,c); xf = (f,c,c)
+        yb = (c,b,c); yf = (c,f,c)
+        zb = (c,c,b); zf = (c,c,f)
+        cc = (c,c,c)
+
+        pc2 = 2 * p_pad[cc]
+        # x-direction
+        cp.subtract(p_pad[xf], pc2, out=out); out += p_pad[xb]; out *= self.dx2
+        # y-direction
+        cp.subtract(p_pad[yf], pc2, out=tmp); tmp += p_pad[yb]; tmp *= self.dy2
+        out += tmp
+        # z-direction
+        cp.subtract(p_pad[zf], pc2, out=tmp); tmp += p_pad[zb]; tmp *= self.dz2
+        out += tmp
+        return
+
+    def cg(self, b, x, tol:float, work:tuple) -> None:
+        """
+        Conjugate gradient iterations for laplace(x) = b. The solution x is 
+        updated in-place (x is also the initial guess).
+
+        Args:
+            b (ndarray)   : Right hand side.
+            x (ndarray)   : Solution (and initial guess).
+            tol (float)   : Relative tolerance |r| <= tol * |b|.
+            work (tuple)  : Work arrays with the same dtype as b and x.
+        """
+        cp = self.grid.cp
+        r, d, Ad, tmp, s = work
+
+        # stopping criterion: |r| <= tol * |b|
+        b_norm = float(cp.sqrt(cp.vdot(b, b)))
+        if b_norm == 0:
+            x[:] = 0
+            return
+        r_tol = (tol * b_norm)**2
+
+        # initial residual r = b - A x (without the mean of b, which is in
+        # the null space of the periodic laplacian and can't be reduced)
+        self.laplace(x, r, tmp)
+        cp.subtract(b, r, out=r)
+        r -= cp.mean(r)
+        self.apply_preconditioner(r, s)
+        d[:] = s
+        rs = cp.vdot(r, s)
+        rr = cp.vdot(r, r)
+
+        for _ in range(self.mset.max_cg_iter):
+            if float(rr) <= r_tol:
+                break
+            self.laplace(d, Ad, tmp)
+            dAd = cp.vdot(d, Ad)
+            # no search direction left (r only in the null space)
+            if float(dAd) == 0 or float(rs) == 0:
+                break
+            alpha = rs / dAd
+            # x += alpha * d ; r -= alpha * Ad
+            x += alpha * d
+            r -= alpha * Ad
+            rr = cp.vdot(r, r)
+            # s = M^-1 r ; d = s + beta * d
+            self.apply_preconditioner(r, s)
+            rs_new = rr if s is r else cp.vdot(r, s)
+            d *= rs_new / rs
+            d += s
+            rs = rs_new
         return
 
     def __call__(self, div:FieldVariable, p:FieldVariable):
         """
-        Solve for the pressure.
+        Solve for the pressure. The pressure field is used as initial guess
+        and is updated in-place.
 
         Args:
             div (FieldVariable) : Divergence.
             p (FieldVariable)   : Pressure field.
         """
-        maxiter = self.mset.max_cg_iter
-        cg_tol  = self.mset.cg_tol
+        if not self.mixed_precision:
+            self.cg(div.arr, p.arr, self.mset.cg_tol, self.work)
+            return
+
+        # mixed precision: iterative refinement
+        cp = self.grid.cp
+        b = div.arr; x = p.arr
+        r, _, _, tmp, _ = self.work
+        r_low = self.r_low; e_low = self.e_low
+
+        b_norm = float(cp.sqrt(cp.vdot(b, b)))
+        r_tol = (self.mset.cg_tol * b_norm)**2
 
-        p[:], info = self.cg(self.A, div.reshape(-1), x0=p.reshape(-1),
-                             tol=cg_tol, maxiter=maxiter)
+        for _ in range(self.max_refine):
+            # full precision residual r = b - A x (without the mean)
+            self.laplace(x, r, tmp)
+            cp.subtract(b, r, out=r)
+            r -= cp.mean(r)
+            if float(cp.vdot(r, r)) <= r_tol:
+                break
+            # solve for the correction in low precision
+            r_low[:] = r
+            e_low[:] = 0
+            self.cg(r_low, e_low, self.low_tol, self.work_low)
+            x += e_low
         return
@@ -18,7 +18,7 @@ class SourceTendency:
 
         self.z = None # to be set
         # add a timer
-        self.timer.add_component('Source')
+        self.timing = self.timer.add_component('Source')
         return
 
     def __call__(self, dz: State, time: float):
@@ -30,7 +30,7 @@ class SourceTendency:
             time (float):   current time in simulation
         """
         # start the timer
-        self.timer.get("Source").start()
+        self.timing.start()
 
         self.z.update(time)
 
@@ -40,5 +40,5 @@ class SourceTendency:
         dz.b[:] += self.z.b
 
         # stop the timer
-        self.timer.get("Source").stop()
+        self.timing.stop()
         return
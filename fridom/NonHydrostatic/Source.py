@@ -54,12 +54,13 @@ class WaveMaker(Source):
 
         # shorthand
         cp = self.cp
-        X, Y, Z = tuple(grid.X)
+        x, y, z = tuple(grid.x)
 
-        # Create gaussian mask
-        mask = cp.exp(-((X - position[0])**2 / width[0]**2 +
-                        (Y - position[1])**2 / width[1]**2 +
-                        (Z - position[2])**2 / width[2]**2))
+        # Create gaussian mask (separable, only the product is 3D)
+        gauss = lambda x, pos, width: cp.exp(-(x - pos)**2 / width**2)
+        mask = (gauss(x, position[0], width[0])[:, None, None] *
+                gauss(y, position[1], width[1])[None, :, None] *
+                gauss(z, position[2], width[2])[None, None, :])
 
         # Store parameters
         self.position  = position
@@ -137,7 +138,7 @@ class PolarizedWaveMaker(Source):
 
         # project again on wave mode
         q = VecQ(s, mset, grid)
-        p = VecP(s, mset, grid)
+        p = VecP(s, mset, grid, q=q)
         z = z.fft()
         proj = z.dot(p)
         z_real = (q*proj).fft()
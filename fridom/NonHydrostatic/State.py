@@ -17,9 +17,30 @@ class State(StateBase):
             b = FieldVariable(mset, grid,
                 name="Buoyancy b", is_spectral=is_spectral, bc=BBoundary(mset))
             field_list = [u, v, w, b]
+            # back the fields with one contiguous (4, ...) block
+            data = grid.cp.zeros((4,) + u.arr.shape, dtype=u.arr.dtype)
+            for i, field in enumerate(field_list):
+                field.arr = data[i]
+        else:
+            data = None
         super().__init__(mset, grid, field_list, is_spectral)
         self.constructor = State
+        self._data = data
         return
+
+    @property
+    def data(self):
+        """
+        Contiguous array of shape (4, ...) that holds u, v, w, b.
+        None if the state does not own such a block (e.g. results of
+        arithmetic operations) or if one of the fields was replaced.
+        """
+        if self._data is None:
+            return None
+        for field in self.field_list:
+            if field.arr.base is not self._data:
+                return None
+        return self._data
     
     # ======================================================================
     #  ENERGY
@@ -70,6 +91,24 @@ class State(StateBase):
         return FieldVariable(self.mset, self.grid, is_spectral=False,
                              name="Total Energy", arr=etot, bc=TriplePeriodic(self.mset))
 
+    def _mean_ekin(self, uh2, w2) -> float:
+        """
+        Mean kinetic energy from the squared horizontal velocity (u^2 + v^2)
+        and the squared vertical velocity. Low precision states are 
+        accumulated in double precision, such that they don't lose digits 
+        in the reduction.
+        """
+        acc = self.cp.float64
+        return 0.5 * self.cp.mean(uh2 + self.mset.dsqr * w2, dtype=acc)
+
+    def _mean_epot(self, b) -> float:
+        """
+        Mean potential energy from the buoyancy array (accumulated in 
+        double precision).
+        """
+        acc = self.cp.float64
+        return 0.5 * self.cp.mean(b**2, dtype=acc) / self.mset.N0**2
+
     def mean_ekin(self) -> float:
         """
         Calculate the mean kinetic energy.
@@ -77,7 +116,12 @@ class State(StateBase):
         Returns:
             mean_ekin (float)  : Mean kinetic energy.
         """
-        return self.cp.mean(self.ekin())
+        # First transform to physical space if necessary
+        z = self
+        if self.is_spectral:
+            z = self.fft()
+        u = z.u.arr; v = z.v.arr; w = z.w.arr
+        return self._mean_ekin(u**2 + v**2, w**2)
     
     def mean_epot(self) -> float:
         """
@@ -86,7 +130,11 @@ class State(StateBase):
         Returns:
             mean_epot (float)  : Mean potential energy.
         """
-        return self.cp.mean(self.epot())
+        # First transform to physical space if necessary
+        z = self
+        if self.is_spectral:
+            z = self.fft()
+        return self._mean_epot(z.b.arr)
     
     def mean_etot(self) -> float:
         """
@@ -95,7 +143,38 @@ class State(StateBase):
         Returns:
             mean_etot (float)  : Mean total energy.
         """
-        return self.cp.mean(self.etot())
+        return self.mean_ekin() + self.mean_epot()
+
+    def diagnostic_bundle(self) -> tuple:
+        """
+        Calculate the mean energies and the maximum CFL numbers at once.
+        Every field is only evaluated once (the mean total energy is the 
+        sum of the mean kinetic and potential energy).
+
+        Returns:
+            mean_ekin (float)  : Mean kinetic energy.
+            mean_epot (float)  : Mean potential energy.
+            mean_etot (float)  : Mean total energy.
+            max_cfl_h (float)  : Maximum horizontal CFL number.
+            max_cfl_v (float)  : Maximum vertical CFL number.
+        """
+        # First transform to physical space if necessary
+        z = self
+        if self.is_spectral:
+            z = self.fft()
+        u = z.u.arr; v = z.v.arr; w = z.w.arr
+
+        # squared velocities (shared by energy and CFL)
+        uh2 = u**2 + v**2
+        w2  = w**2
+
+        mean_ekin = self._mean_ekin(uh2, w2)
+        mean_epot = self._mean_epot(z.b.arr)
+        mean_etot = mean_ekin + mean_epot
+        max_cfl_h = self._max_cfl_h(uh2)
+        max_cfl_v = self._max_cfl_v(w2)
+
+        return mean_ekin, mean_epot, mean_etot, max_cfl_h, max_cfl_v
 
     # ======================================================================
     #  VORTICITY
@@ -240,10 +319,8 @@ class State(StateBase):
         Returns:
             max_cfl_h (float)  : Maximum horizontal CFL number.
         """
-        u = self.u; v = self.v
-        sqrt = self.cp.sqrt; maxi = self.cp.max
-        dx = min(self.mset.dx, self.mset.dy)
-        return sqrt(maxi(u**2 + v**2)) * self.mset.dt / dx
+        u = self.u.arr; v = self.v.arr
+        return self._max_cfl_h(u**2 + v**2)
 
     def max_cfl_v(self) -> float:
         """
@@ -252,9 +329,21 @@ class State(StateBase):
         Returns:
             max_cfl_v (float)  : Maximum vertical CFL number.
         """
-        w = self.w
-        sqrt = self.cp.sqrt; maxi = self.cp.max
-        return sqrt(maxi(w**2)) * self.mset.dt / self.mset.dz
+        w = self.w.arr
+        return self._max_cfl_v(w**2)
+
+    def _max_cfl_h(self, uh2) -> float:
+        """
+        Maximum horizontal CFL number from the squared horizontal velocity.
+        """
+        dx = min(self.mset.dx, self.mset.dy)
+        return self.cp.sqrt(self.cp.max(uh2)) * self.mset.dt / dx
+
+    def _max_cfl_v(self, w2) -> float:
+        """
+        Maximum vertical CFL number from the squared vertical velocity.
+        """
+        return self.cp.sqrt(self.cp.max(w2)) * self.mset.dt / self.mset.dz
 
     def pecl_h(self) -> float:
         """
@@ -29,31 +29,45 @@ class VecQ(State):
         dx = mset.dx; dy = mset.dy;
         f0 = mset.f0; csqr = mset.csqr
 
-        # Discrete spectral operators (one-hat-plus etc.)
-        ohp  = lambda kx, dx: (1 + cp.exp(1j*kx*dx)) / 2
-        ohm  = lambda kx, dx: (1 + cp.exp(-1j*kx*dx)) / 2
-        khp  = lambda kx, dx: 1j * (1 - cp.exp(1j*kx*dx)) / dx
-        ohpm = lambda kx, dx: (1 + cp.cos(kx*dx)) / 2
-        
-        f2_hat = f0**2 * ohpm(kx,dx) * ohpm(ky,dy)
+        # Discrete spectral operators (one-hat-plus etc.), expressed by the
+        # phase factor e = exp(i k dx) which is evaluated once per direction
+        ohp  = lambda e: (1 + e) / 2
+        ohm  = lambda e: (1 + e.conj()) / 2
+        khp  = lambda e, dx: 1j * (1 - e) / dx
+        ohpm = lambda e: (1 + e.real) / 2
+        ex = cp.exp(1j*kx*dx); ey = cp.exp(1j*ky*dy)
+
+        # evaluate each operator only once
+        ohp_x = ohp(ex); ohm_x = ohm(ex); khp_x = khp(ex,dx)
+        ohp_y = ohp(ey); ohm_y = ohm(ey); khp_y = khp(ey,dy)
+
+        f2_hat = f0**2 * ohpm(ex) * ohpm(ey)
 
         # Check the mode of the eigenvector
         is_geostrophic = (s == 0)
 
         om = -s * self.grid.omega_space_discrete
 
-        self.u[:] = (-1j*f0*ohp(kx,dx)*ohm(ky,dy)*khp(ky,dy) + om*khp(kx,dx))
-        self.v[:] = (+1j*f0*ohm(kx,dx)*ohp(ky,dy)*khp(kx,dx) + om*khp(ky,dy))
+        self.u[:] = (-1j*f0*ohp_x*ohm_y*khp_y + om*khp_x)
+        self.v[:] = (+1j*f0*ohm_x*ohp_y*khp_x + om*khp_y)
         self.h[:] = f2_hat - s**2 * om**2
 
-        # Inertial mode
-        self.u[kx**2+ky**2==0] = -1j*s
-        self.v[kx**2+ky**2==0] = s**2
-        self.h[kx**2+ky**2==0] = 1-s**2
+        # Inertial mode (the zero wavenumber is the first entry of fftfreq)
+        self.u[0,0] = -1j*s
+        self.v[0,0] = s**2
+        self.h[0,0] = 1-s**2
 
         if is_geostrophic:
-            self.u[f2_hat==0] = 0
-            self.v[f2_hat==0] = 0
+            # f2_hat vanishes for f0 = 0 or where one of the averaging
+            # operators vanishes (1D masks along each axis)
+            if f0 == 0:
+                self.u[:] = 0
+                self.v[:] = 0
+            else:
+                zx = (ohpm(cp.exp(1j*grid.k[0]*dx)) == 0)
+                zy = (ohpm(cp.exp(1j*grid.k[1]*dy)) == 0)
+                self.u[zx,:] = 0; self.u[:,zy] = 0
+                self.v[zx,:] = 0; self.v[:,zy] = 0
 
 
 
@@ -63,7 +77,7 @@ class VecP(State):
     See the documentation for more details.
     """
 
-    def __init__(self, s, mset:ModelSettings, grid=Grid) -> None:
+    def __init__(self, s, mset:ModelSettings, grid=Grid, q=None) -> None:
         """
         Constructor of the projector on the discrete eigenvectors.
         
@@ -74,34 +88,33 @@ class VecP(State):
                     -1  => negative inertial-gravity)
             mset: The ModelSettings object.
             grid: The Grid object.
+            q   : The eigenvector VecQ(s, mset, grid) if it is already
+                  constructed (default: None => constructed here).
         """
         super().__init__(mset, grid, is_spectral=True)
 
         # Shortcuts
         cp = self.cp
-        kx, ky = tuple(grid.K)
         csqr = mset.csqr
 
-        # Mask to separate inertial modes from inertia-gravity modes
-        g = (kx**2 + ky**2 != 0)
-
         # Construct the eigenvector
-        q = VecQ(s, mset, grid)
-        self.u = q.u.copy(); self.v = q.v.copy(); self.h = q.h.copy()
-        self.h[g] /= csqr
+        if q is None:
+            q = VecQ(s, mset, grid)
+        q.copy(out=self)
+
+        # scale the inertia-gravity modes (all except the zero wavenumber,
+        # which is the first entry of fftfreq)
+        h = self.h.arr
+        h_inertial = h[0,0].copy()
+        h /= csqr
+        h[0,0] = h_inertial
 
         # normalize the vector
         norm = cp.abs(q.dot(self))
-        # avoid division by zero
+        # avoid division by zero (set to zero where the norm is zero)
         mask = (norm > 1e-10)
-        self.u[mask] /= norm[mask]
-        self.v[mask] /= norm[mask]
-        self.h[mask] /= norm[mask]
-        # set to zero where the norm is zero
-        zero_mask = (norm <= 1e-10)
-        self.u[zero_mask] *= 0
-        self.v[zero_mask] *= 0
-        self.h[zero_mask] *= 0
+        inv_norm = cp.where(mask, 1 / cp.where(mask, norm, 1), 0)
+        self.data[:] *= inv_norm
 
 
 class VecQAnalytical(State):
@@ -126,22 +139,23 @@ class VecQAnalytical(State):
 
         # Shortcuts
         kx, ky = tuple(grid.K)
-        kh2 = kx**2 + ky**2
         f0 = mset.f0
-
-        # Mask to separate inertial modes from inertia-gravity modes
-        ng = (kh2 == 0)
+        u = self.u.arr; v = self.v.arr; h = self.h.arr
 
         om = -s * self.grid.omega_analytical
 
-        self.u[:] = -1j * f0 * ky + om * kx
-        self.v[:] = +1j * f0 * kx + om * ky
-        self.h[:] = f0**2 - s**2 * om**2
+        # evaluate the eigenvector in-place
+        # u = -1j * f0 * ky + om * kx
+        u[:] = om; u *= kx; u -= 1j * f0 * ky
+        # v = +1j * f0 * kx + om * ky
+        v[:] = om; v *= ky; v += 1j * f0 * kx
+        # h = f0**2 - s**2 * om**2
+        h[:] = om; h *= h; h *= -s**2; h += f0**2
 
-        # Inertial mode
-        self.u[ng] = -1j*s
-        self.v[ng] = s**2
-        self.h[ng] = 1-s**2
+        # Inertial mode (the zero wavenumber is the first entry of fftfreq)
+        u[0,0] = -1j*s
+        v[0,0] = s**2
+        h[0,0] = 1-s**2
 
 
 class VecPAnalytical(State):
@@ -174,7 +188,7 @@ class VecPAnalytical(State):
 
         # Construct the eigenvector
         q = VecQ(s, mset, grid)
-        self.u = q.u.copy(); self.v = q.v.copy(); self.h = q.h.copy()
+        q.copy(out=self)
         self.h[g] /= csqr
 
         # normalize the vector
@@ -207,19 +207,24 @@ class WavePackage(State):
             self.omega = z.omega
             self.period = z.period
 
-        # Construct mask
-        mask = cp.ones_like(grid.X[0])
-        for x, pos, width in zip(grid.X, mask_pos, mask_width):
+        # Construct mask from 1D gaussians along each axis (exp is only 
+        # evaluated on the 1D coordinates, the full mask is broadcasted)
+        mask = None
+        for i, (x, pos, width) in enumerate(zip(grid.x, mask_pos, mask_width)):
             if pos is not None and width is not None:
-                mask *= cp.exp(-(x - pos)**2 / width**2)
+                shape = [1] * mset.n_dims; shape[i] = -1
+                gauss = cp.exp(-(x - pos)**2 / width**2).reshape(shape)
+                mask = gauss if mask is None else mask * gauss
 
-        z.u *= mask
-        z.v *= mask
-        z.h *= mask
+        # apply the mask (nothing to do if no axis is masked)
+        if mask is not None:
+            z.u *= mask
+            z.v *= mask
+            z.h *= mask
 
         # Project onto the mode again
         q = VecQ(s, mset, grid)
-        p = VecP(s, mset, grid)
+        p = VecP(s, mset, grid, q=q)
 
         z = z.project(p, q)
 
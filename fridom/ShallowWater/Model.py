@@ -201,4 +201,7 @@ class Model(ModelBase):
         self.live_animation.update(z=self.z, time=self.time)
 
     def update_vid_animation(self):
-        self.vid_animation.update(z=self.z.cpu(), time=self.time)
\ No newline at end of file
+        # copy into the CPU buffer of the last frame (the video animation
+        # copies the data when the frame is queued)
+        self.vid_z = self.z.cpu(out=self.vid_z)
+        self.vid_animation.update(z=self.vid_z, time=self.time)
\ No newline at end of file
@@ -46,13 +46,14 @@ class ModelSettings(ModelSettingsBase):
         enable_diag (bool)      : Enable diagnostic output.
         enable_verbose (bool)   : Enable verbose output.
     """
-    def __init__(self, dtype=np.float64, ctype=np.complex128, **kwargs):
+    def __init__(self, dtype=np.float64, ctype=None, **kwargs):
         """
         Constructor.
 
         Args:
             dtype (np.dtype)   : Data type for real.         
-            ctype (np.dtype)   : Data type for complex.
+            ctype (np.dtype)   : Data type for complex (None => complex type
+                                 with the precision of dtype).
         """
         super().__init__(n_dims=2, dtype=dtype, ctype=ctype)
         self.model_name = "ShallowWater"
@@ -176,11 +177,7 @@ class ModelSettings(ModelSettingsBase):
     
     @N.setter
     def N(self, value: list):
-        self._N = [int(val) for val in value]
-        self._dg = [L / N for L, N in zip(self._L, self._N)]
-        self._total_grid_points = 1
-        for n in self._N:
-            self._total_grid_points *= n
+        ModelSettingsBase.N.fset(self, value)
         self.max_cg_iter = max(self._N)
     
     @property
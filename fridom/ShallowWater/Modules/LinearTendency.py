@@ -21,7 +21,7 @@ class LinearTendency:
             self.LinTend = LinearTendencySpectral(mset, grid)
 
         # add a timer for the linear tendency
-        self.timer.add_component('Linear Tendency')
+        self.timing = self.timer.add_component('Linear Tendency')
 
     def __call__(self, z: State, dz: State) -> None:
         """
@@ -32,12 +32,12 @@ class LinearTendency:
             dz (State) : Linear tendency of the state.
         """
         # start the timer
-        self.timer.get("Linear Tendency").start()
+        self.timing.start()
 
         self.LinTend(z, dz)
 
         # stop the timer
-        self.timer.get("Linear Tendency").stop()
+        self.timing.stop()
         return
 
 
@@ -21,7 +21,7 @@ class NonlinearTendency:
             self.NonlinTend = NonlinearTendencySpectral(mset, grid)
 
         # add a timer for the linear tendency
-        self.timer.add_component('Nonlinear Tendency')
+        self.timing = self.timer.add_component('Nonlinear Tendency')
 
     def __call__(self, z: State, dz: State) -> None:
         """
@@ -32,12 +32,12 @@ class NonlinearTendency:
             dz (State) : tendency of the state.
         """
         # start the timer
-        self.timer.get("Nonlinear Tendency").start()
+        self.timing.start()
 
         self.NonlinTend(z, dz)
 
         # stop the timer
-        self.timer.get("Nonlinear Tendency").stop()
+        self.timing.stop()
         return
 
 
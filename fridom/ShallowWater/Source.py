@@ -130,7 +130,7 @@ class PolarizedWaveMaker(Source):
 
         # project again on wave mode
         q = VecQ(s, mset, grid)
-        p = VecP(s, mset, grid)
+        p = VecP(s, mset, grid, q=q)
         z = z.fft()
         proj = z.dot(p)
         z_real = (q*proj).fft()
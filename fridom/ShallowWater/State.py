@@ -15,10 +15,31 @@ class State(StateBase):
             h = FieldVariable(mset, grid,
                 name="Layer Thickness h", is_spectral=is_spectral, bc=HBoundary(mset))
             field_list = [u, v, h]
+            # back the fields with one contiguous (3, ...) block
+            data = grid.cp.zeros((3,) + u.arr.shape, dtype=u.arr.dtype)
+            for i, field in enumerate(field_list):
+                field.arr = data[i]
+        else:
+            data = None
         super().__init__(mset, grid, field_list, is_spectral)
         self.mset = mset
         self.constructor = State
+        self._data = data
         return
+
+    @property
+    def data(self):
+        """
+        Contiguous array of shape (3, ...) that holds u, v, h.
+        None if the state does not own such a block (e.g. results of
+        arithmetic operations) or if one of the fields was replaced.
+        """
+        if self._data is None:
+            return None
+        for field in self.field_list:
+            if field.arr.base is not self._data:
+                return None
+        return self._data
     
     # ======================================================================
     #  ENERGY
@@ -39,7 +60,7 @@ class State(StateBase):
             z = self.fft()
 
         csqr = self.mset.csqr; Ro = self.mset.Ro
-        h_full = csqr + Ro * self.h
+        h_full = csqr + Ro * z.h
         ekin = 0.5 * Ro**2 * h_full * (z.u**2 + z.v**2)
         return FieldVariable(self.mset, self.grid, is_spectral=False, 
                              name="Kinetic Energy", arr=ekin, 
@@ -70,16 +91,61 @@ class State(StateBase):
     def etot(self) -> FieldVariable:
         """
         Calculate the total energy field.
-        $ etot = ekin + epot $
+        $ etot = ekin + epot = 0.5 * h_full * (Ro^2 * (u^2 + v^2) + h_full) $
 
         Returns:
             etot (FieldVariable)  : Total energy field.
         """
-        etot = (self.ekin() + self.epot()).arr
+        # First transform to physical space if necessary (only once)
+        z = self
+        if self.is_spectral:
+            z = self.fft()
+
+        csqr = self.mset.csqr; Ro = self.mset.Ro
+        u = z.u.arr; v = z.v.arr
+        h_full = csqr + Ro * z.h.arr
+        etot = 0.5 * h_full * (Ro**2 * (u**2 + v**2) + h_full)
         return FieldVariable(self.mset, self.grid, is_spectral=False,
                              name="Total Energy", arr=etot, 
                              bc=HBoundary(self.mset))
 
+    def _mean_energy(self, kinetic=True, potential=True) -> float:
+        """
+        Calculate the mean energy without constructing the energy fields.
+        The sums are evaluated as dot products of the physical fields.
+
+        Arguments:
+            kinetic   (bool) : Include the kinetic energy.
+            potential (bool) : Include the potential energy.
+
+        Returns:
+            mean_energy (float) : Mean energy.
+        """
+        # First transform to physical space if necessary
+        z = self
+        if self.is_spectral:
+            z = self.fft()
+
+        cp = self.cp
+        csqr = self.mset.csqr; Ro = self.mset.Ro
+        h_full = csqr + Ro * z.h.arr
+
+        # low precision states are accumulated in double precision, such
+        # that they don't lose digits in the reduction
+        acc = cp.float64
+        if h_full.dtype == acc:
+            dot = cp.vdot
+        else:
+            dot = lambda a, b: cp.sum(a * b, dtype=acc)
+
+        energy = 0
+        if kinetic:
+            u = z.u.arr; v = z.v.arr
+            energy += Ro**2 * (dot(h_full, u*u) + dot(h_full, v*v))
+        if potential:
+            energy += dot(h_full, h_full)
+        return 0.5 * energy / h_full.size
+
     def mean_ekin(self) -> float:
         """
         Calculate the mean kinetic energy.
@@ -87,7 +153,7 @@ class State(StateBase):
         Returns:
             mean_ekin (float)  : Mean kinetic energy.
         """
-        return self.cp.mean(self.ekin())
+        return self._mean_energy(kinetic=True, potential=False)
     
     def mean_epot(self) -> float:
         """
@@ -96,7 +162,7 @@ class State(StateBase):
         Returns:
             mean_epot (float)  : Mean potential energy.
         """
-        return self.cp.mean(self.epot())
+        return self._mean_energy(kinetic=False, potential=True)
     
     def mean_etot(self) -> float:
         """
@@ -105,7 +171,7 @@ class State(StateBase):
         Returns:
             mean_etot (float)  : Mean total energy.
         """
-        return self.cp.mean(self.etot())
+        return self._mean_energy(kinetic=True, potential=True)
 
     # ======================================================================
     #  VORTICITY
@@ -120,13 +186,12 @@ class State(StateBase):
             hor_vort (FieldVariable)  : Horizontal vorticity field.
         """
         # shortcuts
-        dx = self.mset.dx
-        dy = self.mset.dy
         u  = self.u
         v  = self.v
 
         # calculate the horizontal vorticity
-        vort = ((v.diff_forward(0)/dx -  u.diff_forward(1)/dy)
+        # (diff_forward already divides by the grid spacing)
+        vort = ((v.diff_forward(0) -  u.diff_forward(1))
                 ).ave(-1, 0).ave(-1, 1)
 
         # Create the field variable
@@ -147,9 +212,12 @@ class State(StateBase):
         f0 = self.mset.f0; 
         Ro = self.mset.Ro; csqr = self.mset.csqr
 
-        rel_vort = self.hor_vort()
-        h_full = csqr + Ro * self.h
-        pot_vort = (rel_vort + f0) / h_full
+        # evaluate in-place in the (freshly allocated) vorticity array
+        pot_vort = self.hor_vort().arr
+        h_full = Ro * self.h.arr
+        h_full += csqr
+        pot_vort += f0
+        pot_vort /= h_full
 
         # Create the field variable
         field = FieldVariable(self.mset, self.grid, arr=pot_vort,
@@ -160,6 +228,18 @@ class State(StateBase):
     #  CFL AND PECLET NUMBERS
     # ======================================================================
 
+    def _max_speed_squared(self) -> float:
+        """
+        Calculate the maximum of u^2 + v^2 (one temporary array).
+
+        Returns:
+            umax2 (float)  : Maximum squared horizontal velocity.
+        """
+        u = self.u.arr; v = self.v.arr
+        speed2 = u * u
+        speed2 += v * v
+        return float(self.cp.max(speed2))
+
     def max_cfl(self) -> float:
         """
         Calculate the maximum horizontal CFL number.
@@ -167,10 +247,8 @@ class State(StateBase):
         Returns:
             max_cfl (float)  : Maximum horizontal CFL number.
         """
-        u = self.u; v = self.v
-        sqrt = self.cp.sqrt; maxi = self.cp.max
         dx = min(self.mset.dx, self.mset.dy)
-        return sqrt(maxi(u**2 + v**2)) * self.mset.dt / dx
+        return self._max_speed_squared()**0.5 * self.mset.dt / dx
 
     def pecl(self) -> float:
         """
@@ -179,7 +257,7 @@ class State(StateBase):
         Returns:
             pecl (float)  : Horizontal Peclet number.
         """
-        umax = self.cp.max(self.u**2 + self.v**2)
+        umax = self._max_speed_squared()
         res = min(umax*self.mset.dx/(1e-32 + self.mset.ah),
                   umax*self.mset.dx**3/(1e-32 + self.mset.ahbi))
         return res
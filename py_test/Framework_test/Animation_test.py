@@ -0,0 +1,93 @@
+import pytest
+import numpy
+import os, sys
+sys.path.append("../..")
+
+import imageio
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from fridom.Framework.ModelSettingsBase import ModelSettingsBase
+from fridom.Framework.GridBase import GridBase
+from fridom.Framework.FieldVariable import FieldVariable
+from fridom.Framework.Animation import ModelPlotterBase, VideoAnimation
+
+class ValuePlotter(ModelPlotterBase):
+    """
+    Plotter that turns the mean of the field and the time into a gray image
+    """
+    def create_figure():
+        return plt.figure()
+
+    def update_figure(fig, field, time):
+        ValuePlotter.value = 10 * float(field.arr.mean()) + time
+        return
+
+    def convert_to_img(fig):
+        return numpy.full((16, 16, 3), ValuePlotter.value, dtype=numpy.uint8)
+
+
+class FailingPlotter(ValuePlotter):
+    """
+    Plotter that fails for the fifth frame
+    """
+    def update_figure(fig, field, time):
+        if float(field.arr.mean()) == 4:
+            raise ValueError("plotting failed")
+        ValuePlotter.update_figure(fig, field, time)
+        return
+
+
+def get_animation(plotter):
+    """
+    Return a started video animation with two workers and a 2D field
+    """
+    m = ModelSettingsBase(2)
+    m.N = [8, 4]
+    g = GridBase(m)
+    field = FieldVariable(m, g, name="Test")
+
+    vid = VideoAnimation(plotter, "test.gif", fps=10, max_jobs=0)
+    vid.maximum_jobs = 2
+    vid.start_writer()
+    return vid, field
+
+
+class TestVideoAnimation:
+    """
+    Test the parallel video animation
+    """
+    def test_frame_order(self, in_tmp_path):
+        """
+        The frames are rendered by the worker processes from the shared 
+        memory blocks and added to the video in the order of the updates
+        """
+        n_frames = 12
+        vid, field = get_animation(ValuePlotter)
+        for i in range(n_frames):
+            # the buffer is reused, as in the models
+            field[:] = i
+            vid.update(field=field, time=i % 3)
+        vid.stop_writer()
+
+        assert vid.frames_written == n_frames
+        assert vid.blocks is None
+        frames = imageio.mimread(vid.filename)
+        assert len(frames) == n_frames
+        for i, frame in enumerate(frames):
+            assert int(frame[0, 0, 0]) == 10 * i + i % 3
+
+    def test_worker_error(self, in_tmp_path):
+        """
+        An error in a worker process raises a RuntimeError in the main 
+        process instead of waiting for the missing frames
+        """
+        vid, field = get_animation(FailingPlotter)
+        with pytest.raises(RuntimeError, match="plotting failed"):
+            for i in range(12):
+                field[:] = i
+                vid.update(field=field, time=0)
+            vid.stop_writer()
+        assert vid.workers is None
+        assert vid.blocks is None
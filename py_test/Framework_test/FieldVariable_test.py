@@ -52,6 +52,28 @@ class TestFieldVariable(unittest.TestCase):
                     self.assertEqual(cp.allclose(field.arr, arr), True)
                     self.assertEqual(field.name, "Test")
 
+    def test_constructor_no_copy(self):
+        """
+        Test the Constructor with an input array that is not copied
+        """
+        gpu_list = self.get_gpu_list()
+
+        for gpu in gpu_list:
+            m = ModelSettingsBase(3)
+            m.gpu = gpu
+            m.N = [3, 2, 1]
+            g = GridBase(m)
+            cp = g.cp
+            arr = cp.ones(shape=tuple(m.N), dtype=m.dtype)
+            field = FieldVariable(m, g, arr=arr, copy=False)
+            self.assertIs(field.arr, arr)
+
+            # the array is still copied if the dtype does not match
+            arr = cp.ones(shape=tuple(m.N), dtype=numpy.float32)
+            field = FieldVariable(m, g, arr=arr, copy=False)
+            self.assertIsNot(field.arr, arr)
+            self.assertEqual(field.arr.dtype, m.dtype)
+
     def test_zeros(self):
         """
         Test the construction with zeros
@@ -650,4 +672,72 @@ class TestFieldVariable(unittest.TestCase):
             # Test power with array
             pow = ones ** (cp.ones(grid.X[0].shape))
             self.assertEqual(pow.arr[0,0,0], 1)
-    
\ No newline at end of file
+
+    def test_inplace(self):
+        """
+        Test the in-place operators (same object, same array, same dtype)
+        """
+        gpu_list = self.get_gpu_list()
+
+        for gpu in gpu_list:
+            for spectral in [True, False]:
+                m = ModelSettingsBase(3)
+                m.gpu = gpu
+                m.N = [3, 2, 1]
+                grid = GridBase(m)
+                cp = grid.cp
+                field = FieldVariable(
+                    m, grid, is_spectral=spectral, name="Test")
+                other = FieldVariable(
+                    m, grid, is_spectral=spectral, name="Test")
+                field[:] = 1; other[:] = 2
+                dtype = field.arr.dtype
+                field_id = id(field); arr_id = id(field.arr)
+
+                # Test in-place addition with FieldVariable
+                field += other
+                self.assertEqual(field.arr[0,0,0], 3)
+
+                # Test in-place multiplication with scalar
+                field *= 2
+                self.assertEqual(field.arr[0,0,0], 6)
+
+                # Test in-place subtraction with array
+                field -= cp.ones(grid.X[0].shape)
+                self.assertEqual(field.arr[0,0,0], 5)
+
+                # Test in-place division with FieldVariable
+                field /= other
+                self.assertEqual(field.arr[0,0,0], 2.5)
+
+                # Test in-place power with scalar
+                field **= 2
+                self.assertEqual(field.arr[0,0,0], 6.25)
+
+                self.assertEqual(id(field), field_id)
+                self.assertEqual(id(field.arr), arr_id)
+                self.assertEqual(field.arr.dtype, dtype)
+
+    def test_wrap(self):
+        """
+        Test that wrap does not copy a matching array
+        """
+        gpu_list = self.get_gpu_list()
+
+        for gpu in gpu_list:
+            m = ModelSettingsBase(3)
+            m.gpu = gpu
+            m.N = [3, 2, 1]
+            grid = GridBase(m)
+            cp = grid.cp
+            field = FieldVariable(
+                m, grid, is_spectral=False, name="Test")
+            arr = cp.ones(grid.X[0].shape, dtype=m.dtype)
+            wrapped = field.wrap(arr)
+            self.assertIs(wrapped.arr, arr)
+            self.assertEqual(wrapped.name, "Test")
+
+            # spectral wrap converts to the complex dtype
+            wrapped = field.wrap(arr, is_spectral=True)
+            self.assertEqual(wrapped.is_spectral, True)
+            self.assertEqual(wrapped.arr.dtype, m.ctype)
@@ -0,0 +1,50 @@
+import numpy
+import os, sys
+sys.path.append("../..")
+
+from netCDF4 import Dataset
+
+from fridom.Framework.ModelSettingsBase import ModelSettingsBase
+from fridom.Framework.GridBase import GridBase
+from fridom.Framework.NetCDFWriter import NetCDFWriter
+
+
+class TestNetCDFWriter:
+    """
+    Test the NetCDF writer
+    """
+    def test_buffered_write(self, gpu, in_tmp_path):
+        """
+        Write buffered snapshots, flush an incomplete buffer and read
+        the NetCDF file back
+        """
+        m = ModelSettingsBase(3)
+        m.gpu = gpu
+        m.N = [4, 3, 2]
+        m.enable_snap = True
+        m.snap_buffer_size = 3
+        g = GridBase(m)
+        cp = g.cp
+
+        writer = NetCDFWriter(m, g)
+        writer.set_var_names(["a", "b"], ["A", "B"], ["m", "s"])
+        writer.start()
+
+        # 4 snapshots: one full buffer and one flushed snapshot
+        a = [cp.full(tuple(m.N), i, dtype=m.dtype) for i in range(4)]
+        b = [g.X[0] + i for i in range(4)]
+        for i in range(4):
+            writer.write_cdf([a[i], b[i]], time=float(i))
+        assert len(writer.buffer_times) == 1
+        writer.flush()
+        assert len(writer.buffer_times) == 0
+        writer.close()
+
+        get = lambda x: x.get() if gpu else x
+        with Dataset(writer.filename, "r") as ncfile:
+            assert list(ncfile["time"][:]) == [0., 1., 2., 3.]
+            # the spatial axes are stored in reversed order
+            assert ncfile["a"].shape == (4,) + tuple(m.N[::-1])
+            for i in range(4):
+                assert numpy.allclose(ncfile["a"][i], get(a[i]).T)
+                assert numpy.allclose(ncfile["b"][i], get(b[i]).T)
@@ -0,0 +1,95 @@
+import pytest
+import numpy
+import os, sys
+sys.path.append("../..")
+
+from fridom.NonHydrostatic.ModelSettings import ModelSettings
+from fridom.NonHydrostatic.Grid import Grid
+from fridom.NonHydrostatic.BoundaryConditions import PBoundary
+from fridom.Framework.FieldVariable import FieldVariable
+from fridom.NonHydrostatic.Modules.PressureSolve import CGSolver, SpectralSolver
+
+
+def get_div(mset, grid):
+    """
+    Return a random divergence field with zero mean
+    """
+    cp = grid.cp
+    div = FieldVariable(mset, grid, bc=PBoundary(mset))
+    numpy.random.seed(1)
+    div[:] = cp.asarray(numpy.random.standard_normal(div.shape))
+    div[:] -= div.arr.mean()
+    return div
+
+def solve(solver, mset, grid, div):
+    """
+    Solve for the pressure and remove the mean
+    """
+    p = FieldVariable(mset, grid, bc=PBoundary(mset))
+    solver(mset, grid)(div, p)
+    p[:] -= p.arr.mean()
+    return p
+
+
+class TestPressureSolve:
+    """
+    Test the pressure solvers
+    """
+    @pytest.mark.parametrize("pressure_dtype", [None, numpy.float32])
+    @pytest.mark.parametrize("precondition", [False, True])
+    def test_cg_periodic(self, gpu, pressure_dtype, precondition):
+        """
+        Test the CG solver against the spectral solver on a periodic grid
+        """
+        m = ModelSettings(
+            gpu=gpu, N=[16, 16, 8], cg_tol=1e-12, max_cg_iter=2000, 
+            pressure_dtype=pressure_dtype, cg_precondition=precondition)
+        g = Grid(m)
+        cp = g.cp
+        div = get_div(m, g)
+
+        p_spectral = solve(SpectralSolver, m, g, div)
+        p_cg = solve(CGSolver, m, g, div)
+        assert p_cg.arr.dtype == m.dtype
+        assert cp.allclose(p_cg.arr, p_spectral.arr, atol=1e-8)
+
+    @pytest.mark.parametrize("pressure_dtype", [None, numpy.float32])
+    @pytest.mark.parametrize("precondition", [False, True])
+    def test_cg_nonzero_mean(self, gpu, pressure_dtype, precondition):
+        """
+        Test the CG solver with a right hand side that has a nonzero mean
+        (the mean is in the null space of the periodic laplacian)
+        """
+        m = ModelSettings(
+            gpu=gpu, N=[16, 16, 8], cg_tol=1e-12, max_cg_iter=2000, 
+            pressure_dtype=pressure_dtype, cg_precondition=precondition)
+        g = Grid(m)
+        cp = g.cp
+        div = get_div(m, g)
+        div[:] += 1
+
+        p_spectral = solve(SpectralSolver, m, g, div)
+        p_cg = solve(CGSolver, m, g, div)
+        assert cp.isfinite(p_cg.arr).all()
+        assert cp.allclose(p_cg.arr, p_spectral.arr, atol=1e-8)
+
+    @pytest.mark.parametrize("periodic", 
+                             [[True, True, False], [False, True, False]])
+    @pytest.mark.parametrize("pressure_dtype", [None, numpy.float32])
+    def test_cg_precondition_non_periodic(self, gpu, periodic, pressure_dtype):
+        """
+        Test the preconditioned CG solver on grids with non-periodic
+        boundaries against the CG solver without preconditioner
+        """
+        kw = dict(gpu=gpu, N=[16, 16, 8], cg_tol=1e-12, max_cg_iter=2000, 
+                  periodic_bounds=periodic, pressure_dtype=pressure_dtype)
+        m = ModelSettings(cg_precondition=False, **kw)
+        m_pre = ModelSettings(cg_precondition=True, **kw)
+        g = Grid(m)
+        g_pre = Grid(m_pre)
+        cp = g.cp
+        div = get_div(m, g)
+
+        p_cg = solve(CGSolver, m, g, div)
+        p_pre = solve(CGSolver, m_pre, g_pre, div)
+        assert cp.allclose(p_pre.arr, p_cg.arr, atol=1e-8)
@@ -0,0 +1,32 @@
+import pytest
+
+
+def get_gpu_list():
+    """
+    Return a list of booleans weather to test on gpu or not
+    """
+    gpu_list = [False]
+    try:
+        import cupy
+        gpu_list.append(True)
+    except ImportError:
+        pass
+    return gpu_list
+
+
+@pytest.fixture(params=get_gpu_list(), ids=lambda gpu: "gpu" if gpu else "cpu")
+def gpu(request):
+    """
+    Run the test on the cpu (and on the gpu if cupy is available)
+    """
+    return request.param
+
+
+@pytest.fixture
+def in_tmp_path(tmp_path, monkeypatch):
+    """
+    Run the test in a temporary working directory (the writers create 
+    their output folders in the working directory)
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path